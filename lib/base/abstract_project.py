@@ -145,23 +145,23 @@ class AbstractProject(ABC):
         Returns:
             None
         """
-        existing_document = self.ydm.check_project_exists(self.project_id)
-        if not existing_document:
-            # Create the project in YggdrasilDB
-            self.ydm.create_project(
-                self.project_id,
-                self.doc_id,
-                self.project_name,
-                self.method,
-                self.user_info,
-                self.is_sensitive,
-            )
+        # Create the project in YggdrasilDB, or get the stored one if it exists
+        document, created = self.ydm.ensure_project(
+            self.project_id,
+            self.doc_id,
+            self.project_name,
+            self.method,
+            self.user_info,
+            self.is_sensitive,
+        )
+        if created:
             logging.info(f"Project {self.project_id} created in YggdrasilDB.")
             self.proceed = True
         else:
-            logging.info(f"Project {self.project_id} already exists in YggdrasilDB.")
-            document = self.ydm.get_document_by_project_id(self.project_id)
             if document:
+                logging.info(
+                    f"Project {self.project_id} already exists in YggdrasilDB."
+                )
                 self.project_status = document.project_status
                 if self.project_status == "completed":
                     logging.info(
@@ -1,6 +1,8 @@
+import asyncio
 import importlib
 import logging
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -173,6 +175,20 @@ class YggdrasilUtilities:
             )
             pass
 
+    @staticmethod
+    def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+        """Return the event loop factory for `asyncio.Runner`.
+
+        Returns:
+            Optional[Callable]: uvloop's loop factory when uvloop is installed,
+                otherwise None so the default asyncio loop is used.
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return None
+        return uvloop.new_event_loop
+
     @staticmethod
     def normalize_url(url: str) -> str:
         if not url.startswith(("http://", "https://")):
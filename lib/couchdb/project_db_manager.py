@@ -1,5 +1,6 @@
+import asyncio
 import json
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from typing import Any, cast
 
 from requests import Response
@@ -11,6 +12,16 @@ from lib.couchdb.couchdb_connection import CouchDBHandler
 
 logging = custom_logger(__name__.split(".")[-1])
 
+_json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catching the stdlib error keep working
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads  # fall back to the stdlib parser
+
 
 class ProjectDBManager(CouchDBHandler):
     """
@@ -22,6 +33,10 @@ class ProjectDBManager(CouchDBHandler):
     It is specialized for Yggdrasil needs (e.g., module registry lookups).
     """
 
+    # CouchDB sends a newline this often (ms) on a quiet changes feed, so the
+    # reader thread never blocks for longer and shutdown is not held up
+    CHANGES_HEARTBEAT_MS = 1000
+
     def __init__(self) -> None:
         super().__init__("projects")
         self.module_registry = ConfigLoader().load_config("module_registry.json")
@@ -81,37 +96,55 @@ class ProjectDBManager(CouchDBHandler):
             db=self.db_name,
             feed="continuous",
             since=last_processed_seq,
-            include_docs=False,
+            include_docs=True,
+            heartbeat=self.CHANGES_HEARTBEAT_MS,
         ).get_result()
 
         # Type assertion: we expect a Response object for streaming
         changes = cast(Response, response)  # Makes Pylance happy
 
-        for line in changes.iter_lines():
-            # Reduce nesting / skip empty lines
-            if not line:
-                continue
-
-            change = json.loads(line)
-
-            # Only process real change entries
-            if "id" not in change or "seq" not in change:
-                continue
-
-            try:
-                doc = self.fetch_document_by_id(change["id"])
-                last_processed_seq = change["seq"]
-                if last_processed_seq is not None:
-                    Ygg.save_last_processed_seq(last_processed_seq)
-                else:
-                    logging.warning(
-                        "Received `None` for last_processed_seq. Skipping save."
-                    )
-
-                if doc is not None:
-                    yield doc
-                else:
-                    logging.warning(f"Document with ID {change['id']} is None.")
-            except Exception as e:
-                logging.warning(f"Error processing change: {e}")
-                logging.debug(f"Data causing the error: {change}")
+        # iter_lines() blocks until the feed sends something, so each line is
+        # read in a worker thread to keep the event loop (and running realms)
+        # going while the feed is quiet. The response is closed when the
+        # generator exits, including on cancellation at shutdown.
+        try:
+            lines = iter(changes.iter_lines())
+            while (line := await asyncio.to_thread(next, lines, None)) is not None:
+                # Reduce nesting / skip empty (heartbeat) lines
+                if not line:
+                    continue
+
+                change = _json_loads(line)
+
+                # Only process real change entries
+                if "id" not in change or "seq" not in change:
+                    continue
+
+                try:
+                    # The feed carries the document, so no per-change GET is needed;
+                    # fall back to fetching it if the body is missing
+                    if change.get("deleted"):
+                        doc = None
+                    elif isinstance(change.get("doc"), dict):
+                        doc = change["doc"]
+                    else:
+                        doc = await asyncio.to_thread(
+                            self.fetch_document_by_id, change["id"]
+                        )
+                    last_processed_seq = change["seq"]
+                    if last_processed_seq is not None:
+                        Ygg.save_last_processed_seq(last_processed_seq)
+                    else:
+                        logging.warning(
+                            "Received `None` for last_processed_seq. Skipping save."
+                        )
+
+                    if doc is not None:
+                        yield doc
+                    else:
+                        logging.warning(f"Document with ID {change['id']} is None.")
+                except Exception as e:
+                    logging.warning(f"Error processing change: {e}")
+                    logging.debug(f"Data causing the error: {change}")
+        finally:
+            changes.close()
@@ -43,8 +43,13 @@ def auto_load_and_save(method: Callable) -> Callable:
 class YggdrasilDBManager(CouchDBHandler):
     """Manages interactions with the 'yggdrasil' database."""
 
+    # Upper bound on the number of document revisions remembered per manager
+    REV_CACHE_SIZE = 256
+
     def __init__(self) -> None:
         super().__init__("yggdrasil")
+        # Latest known _rev per document ID, so saves can skip the pre-PUT GET
+        self._rev_cache: dict[str, str] = {}
 
     def create_project(
         self,
@@ -69,6 +74,68 @@ class YggdrasilDBManager(CouchDBHandler):
         Returns:
             YggdrasilDocument: The newly created project document.
         """
+        new_document = self._new_project_document(
+            project_id, projects_reference, project_name, method, user_info, sensitive
+        )
+        self.save_document(new_document)
+        logging.info(f"New project with ID '{project_id}' created successfully.")
+        return new_document
+
+    def ensure_project(
+        self,
+        project_id: str,
+        projects_reference: str,
+        project_name: str,
+        method: str,
+        user_info: dict[str, dict[str, str | None]] | None = None,
+        sensitive: bool | None = True,
+    ) -> tuple[YggdrasilDocument | None, bool]:
+        """Creates a project document unless it already exists.
+
+        The new document is PUT without a _rev, which CouchDB only accepts for
+        an unused ID; a 409 conflict means the project already exists, and the
+        stored document is loaded instead. This replaces a separate existence
+        check and create, and cannot race with another writer.
+
+        Args:
+            project_id (str): The project ID.
+            projects_reference (str): Reference to the original project document.
+            project_name (str): The project name.
+            method (str): The library construction method.
+            user_info (Optional[Dict[str, Dict[str, str]]]): Nested dict of user info.
+            sensitive (bool): True if data is sensitive. Defaults to True.
+
+        Returns:
+            tuple[YggdrasilDocument | None, bool]: The project document (None if it
+                could not be created or loaded) and whether this call created it.
+        """
+        new_document = self._new_project_document(
+            project_id, projects_reference, project_name, method, user_info, sensitive
+        )
+        try:
+            self._put_document(new_document, None)
+        except ApiException as e:
+            if e.code != 409:
+                logging.error(f"Error creating project '{project_id}': {e}")
+                return None, False
+            return self.get_document_by_project_id(project_id), False
+        except Exception as e:
+            logging.error(f"Error creating project '{project_id}': {e}")
+            return None, False
+
+        logging.info(f"New project with ID '{project_id}' created successfully.")
+        return new_document, True
+
+    def _new_project_document(
+        self,
+        project_id: str,
+        projects_reference: str,
+        project_name: str,
+        method: str,
+        user_info: dict[str, dict[str, str | None]] | None,
+        sensitive: bool | None,
+    ) -> YggdrasilDocument:
+        """Build an unsaved project document with user info and sensitivity set."""
         new_document = YggdrasilDocument(
             project_id=project_id,
             projects_reference=projects_reference,
@@ -83,9 +150,6 @@ class YggdrasilDBManager(CouchDBHandler):
 
         # Set sensitive flag to True by default (better safe than sorry)
         new_document.delivery_info["sensitive"] = sensitive
-
-        self.save_document(new_document)
-        logging.info(f"New project with ID '{project_id}' created successfully.")
         return new_document
 
     def save_document(self, document: YggdrasilDocument) -> None:
@@ -93,6 +157,9 @@ class YggdrasilDBManager(CouchDBHandler):
         Save a document to the CouchDB database. If the document already exists,
         it updates the existing document while preserving the revision (_rev) field
         to avoid update conflicts.
+        The revision is taken from the revisions remembered from earlier
+        loads/saves; only when none is known (or it turns out to be stale) is the
+        current document fetched first.
         Args:
             document (YggdrasilDocument): The document to be saved, which must have
                           an _id attribute and a to_dict() method.
@@ -101,6 +168,17 @@ class YggdrasilDBManager(CouchDBHandler):
                    is logged with the error message.
         """
         try:
+            rev = self._rev_cache.get(document._id)
+            if rev is not None:
+                try:
+                    self._put_document(document, rev)
+                    return
+                except ApiException as e:
+                    if e.code != 409:
+                        raise
+                    # Stale revision: forget it and fall back to a fresh lookup
+                    self._rev_cache.pop(document._id, None)
+
             try:
                 existing_doc = self.server.get_document(
                     db=self.db_name, doc_id=document._id
@@ -111,21 +189,35 @@ class YggdrasilDBManager(CouchDBHandler):
                 else:
                     raise
 
-            doc_dict = document.to_dict()
-            if existing_doc and "_rev" in existing_doc:
-                # Preserve the _rev field to avoid update conflicts
-                doc_dict["_rev"] = existing_doc["_rev"]
-
-            # Keep parity with couchdb.Database.save(): internally used PUT /{db}/{id}
-            self.server.put_document(
-                db=self.db_name, doc_id=document._id, document=doc_dict
-            ).get_result()
-            logging.info(
-                f"Document with ID '{document._id}' saved successfully in '{self.db_name}' DB."
-            )
+            # Preserve the _rev field to avoid update conflicts
+            rev = existing_doc.get("_rev") if existing_doc else None
+            self._put_document(document, rev)
         except Exception as e:
             logging.error(f"Error saving document: {e}")
 
+    def _put_document(self, document: YggdrasilDocument, rev: str | None) -> None:
+        """PUT a document (with the given _rev, if any) and remember its new _rev."""
+        doc_dict = document.to_dict()
+        if rev:
+            doc_dict["_rev"] = rev
+
+        # Keep parity with couchdb.Database.save(): internally used PUT /{db}/{id}
+        result = self.server.put_document(
+            db=self.db_name, doc_id=document._id, document=doc_dict
+        ).get_result()
+        if isinstance(result, dict) and result.get("rev"):
+            self._remember_rev(document._id, result["rev"])
+        logging.info(
+            f"Document with ID '{document._id}' saved successfully in '{self.db_name}' DB."
+        )
+
+    def _remember_rev(self, doc_id: str, rev: str) -> None:
+        """Record the latest revision of a document, evicting the oldest entry."""
+        self._rev_cache.pop(doc_id, None)
+        self._rev_cache[doc_id] = rev
+        if len(self._rev_cache) > self.REV_CACHE_SIZE:
+            del self._rev_cache[next(iter(self._rev_cache))]
+
     def get_document_by_project_id(self, project_id: str) -> YggdrasilDocument | None:
         """Retrieves a document by project ID.
 
@@ -137,6 +229,8 @@ class YggdrasilDBManager(CouchDBHandler):
         """
         document = self.fetch_document_by_id(project_id)
         if document:
+            if document.get("_rev"):
+                self._remember_rev(project_id, document["_rev"])
             return YggdrasilDocument.from_dict(document)
         else:
             return None
@@ -1,4 +1,5 @@
 import datetime
+import sys
 from typing import Any, Dict, List, Optional
 
 from lib.core_utils.logging_utils import custom_logger
@@ -21,6 +22,32 @@ class YggdrasilDocument:
         samples (List[Dict[str, Any]]): List of samples associated with the project.
     """
 
+    # Sample status groups used by check_project_completion
+    # You may adjust these sets to match your real usage
+    ACTIVE_SAMPLE_STATUSES = frozenset(
+        {
+            "initialized",
+            "processing",
+            "pre_processing",
+            "post_processing",
+            "requires_manual_submission",
+        }
+    )
+    FINISHED_SAMPLE_STATUSES = frozenset({"completed", "aborted"})
+    NOT_YET_STARTED_STATUSES = frozenset({"pending", "unsequenced"})
+
+    # Keys every NGI report entry must carry (see add_ngi_report_entry)
+    NGI_REPORT_REQUIRED_KEYS = frozenset(
+        {
+            "file_name",
+            "date_created",
+            "signee",
+            "date_signed",
+            "rejected",
+            "samples_included",
+        }
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "YggdrasilDocument":
         """Creates a YggdrasilDocument instance from a dictionary.
@@ -44,8 +71,12 @@ class YggdrasilDocument:
         )
         instance.end_date = data.get("end_date", "")
 
-        # Samples
+        # Samples; statuses are interned so the many copies of the same few
+        # values share one string object
         instance.samples = data.get("samples", [])
+        for sample in instance.samples:
+            if isinstance(sample.get("status"), str):
+                sample["status"] = sys.intern(sample["status"])
 
         # User info
         instance.user_info = data.get("user_info", {})
@@ -163,6 +194,7 @@ class YggdrasilDocument:
             start_time (str, optional): Start time of the sample processing.
             end_time (str, optional): End time of the sample processing.
         """
+        status = sys.intern(status)
         existing_sample = self.get_sample(sample_id)
         if existing_sample:
             # Update existing sample
@@ -227,7 +259,7 @@ class YggdrasilDocument:
             )
             return False
 
-        sample["status"] = status
+        sample["status"] = sys.intern(status)
         current_time = datetime.datetime.now().isoformat()
 
         # TODO: This is not correct. The start time should be set when the sample is actually started.
@@ -359,36 +391,21 @@ class YggdrasilDocument:
             project -> 'pending'
             4) Otherwise, project -> 'partially_completed'
         """
-        # You may adjust these sets to match your real usage
-        active_sample_statuses = {
-            "initialized",
-            "processing",
-            "pre_processing",
-            "post_processing",
-            "requires_manual_submission",
-        }
-        finished_sample_statuses = {"completed", "aborted"}
-        not_yet_started_statuses = {"pending", "unsequenced"}
-
-        # Collect all sample statuses into a set for quick membership checks
-        sample_statuses = [sample["status"] for sample in self.samples]
-        unique_sample_statuses = set(sample_statuses)
-
-        # 1) If any sample is "active" => project is 'processing'
-        if any(
-            sample_status in active_sample_statuses
-            for sample_status in unique_sample_statuses
-        ):
-            # self.project_status = "processing"
-            # self.end_date = ""  # not fully completed
-            self.update_project_status("processing")
-            return
+        # Collect the distinct sample statuses in one pass, stopping at the
+        # first active sample since that alone decides the outcome
+        sample_statuses: set[str] = set()
+        for sample in self.samples:
+            status = sample["status"]
+            # 1) If any sample is "active" => project is 'processing'
+            if status in self.ACTIVE_SAMPLE_STATUSES:
+                # self.project_status = "processing"
+                # self.end_date = ""  # not fully completed
+                self.update_project_status("processing")
+                return
+            sample_statuses.add(status)
 
         # 2) If ALL samples are "finished" => 'completed'
-        if all(
-            sample_status in finished_sample_statuses
-            for sample_status in unique_sample_statuses
-        ):
+        if sample_statuses <= self.FINISHED_SAMPLE_STATUSES:
             # self.project_status = "completed"
             # if not self.end_date:
             #     self.end_date = datetime.datetime.now().isoformat()
@@ -396,10 +413,7 @@ class YggdrasilDocument:
             return
 
         # 3) If ALL samples are "not_yet_started" => 'pending'
-        if all(
-            sample_status in not_yet_started_statuses
-            for sample_status in unique_sample_statuses
-        ):
+        if sample_statuses <= self.NOT_YET_STARTED_STATUSES:
             # self.project_status = "pending"
             # self.end_date = ""
             self.update_project_status("pending")
@@ -436,15 +450,10 @@ class YggdrasilDocument:
           "samples_included": [...]
         }
         """
-        required_keys = {
-            "file_name",
-            "date_created",
-            "signee",
-            "date_signed",
-            "rejected",
-            "samples_included",
-        }
-        if isinstance(report_data, dict) and required_keys.issubset(report_data.keys()):
+        if (
+            isinstance(report_data, dict)
+            and self.NGI_REPORT_REQUIRED_KEYS <= report_data.keys()
+        ):
             self.ngi_report.append(report_data)
             return True
         else:
@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Optional
 
@@ -12,7 +13,7 @@ class YggdrasilEvent:
         event_type (str): A string identifying the type of event (e.g. "document_change").
         payload (Any): Arbitrary data relevant to the event (e.g. info about a changed file).
         source (str): Identifier of the event source (e.g. "filesystem", "couchdb").
-        timestamp (datetime.datetime): When the event was created.
+        timestamp (float): When the event was created, as seconds since the epoch.
     """
 
     __slots__ = ("event_type", "payload", "source", "timestamp")
@@ -21,7 +22,9 @@ class YggdrasilEvent:
         self.event_type = event_type
         self.payload = payload
         self.source = source
-        self.timestamp = datetime.datetime.now()
+        # A plain float is much cheaper to create than a datetime; it is only
+        # converted when the event is rendered
+        self.timestamp = time.time()
 
     def __repr__(self) -> str:
         return (
@@ -29,7 +32,7 @@ class YggdrasilEvent:
             f"event_type={self.event_type!r}, "
             f"payload={self.payload!r}, "
             f"source={self.source!r}, "
-            f"timestamp={self.timestamp.isoformat()})"
+            f"timestamp={datetime.datetime.fromtimestamp(self.timestamp).isoformat()})"
         )
 
 
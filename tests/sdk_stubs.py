@@ -0,0 +1,46 @@
+"""Process-wide stand-ins for the IBM Cloud SDK used by the CouchDB tests.
+
+Importing this module installs the stubs into ``sys.modules`` once per
+process; later imports (from other test modules) reuse the same objects.
+"""
+
+import sys
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from unittest.mock import Mock
+
+# Returned for every unknown attribute of a stub module, so lookups never
+# grow a tree of child mocks.
+_STUB_SENTINEL = Mock(spec=[])
+
+
+class _StubModule(ModuleType):
+    def __init__(self, name):
+        super().__init__(name)
+        # A real spec keeps importlib.util.find_spec() working on the stubs
+        self.__spec__ = ModuleSpec(name, None)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _STUB_SENTINEL
+
+
+class MockApiException(Exception):
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+if "ibm_cloud_sdk_core" not in sys.modules:
+    api_exception_module = _StubModule("ibm_cloud_sdk_core.api_exception")
+    api_exception_module.ApiException = MockApiException  # type: ignore[attr-defined]
+    cloudant_v1_module = _StubModule("ibmcloudant.cloudant_v1")
+    ibmcloudant_module = _StubModule("ibmcloudant")
+    ibmcloudant_module.cloudant_v1 = cloudant_v1_module  # type: ignore[attr-defined]
+
+    sys.modules["ibm_cloud_sdk_core"] = _StubModule("ibm_cloud_sdk_core")
+    sys.modules["ibm_cloud_sdk_core.api_exception"] = api_exception_module
+    sys.modules["ibmcloudant"] = ibmcloudant_module
+    sys.modules["ibmcloudant.cloudant_v1"] = cloudant_v1_module
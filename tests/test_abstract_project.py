@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from lib.base.abstract_project import AbstractProject
+
+
+class _Project(AbstractProject):
+    """Minimal concrete realm project for exercising the base class."""
+
+    def check_required_fields(self):
+        return True
+
+    async def launch(self):
+        pass
+
+    def create_slurm_job(self, data):
+        return ""
+
+    def post_process(self, result):
+        pass
+
+    def do_extract_samples(self):
+        return []
+
+
+class TestAbstractProject(unittest.TestCase):
+    """
+    Tests for AbstractProject.initialize_project_in_db, which creates the
+    project in YggdrasilDB or decides from the stored one whether to proceed.
+    """
+
+    def setUp(self):
+        """Set up a project backed by a mocked YggdrasilDBManager."""
+        self.factory_patcher = patch(
+            "lib.base.abstract_project.SlurmManagerFactory.get_manager"
+        )
+        self.factory_patcher.start()
+        self.addCleanup(self.factory_patcher.stop)
+
+        self.mock_ydm = MagicMock()
+        self.doc = {
+            "_id": "ref_12345",
+            "project_id": "P12345",
+            "project_name": "Test Project",
+            "details": {
+                "library_construction_method": "10X",
+                "sensitive_data": "Yes",
+            },
+        }
+        self.project = _Project(self.doc, self.mock_ydm)
+
+    def _stored_document(self, status):
+        """A stored project document with the given status."""
+        document = MagicMock()
+        document.project_status = status
+        self.mock_ydm.get_document_by_project_id.return_value = document
+        return document
+
+    def test_initialize_project_created(self):
+        """Test a newly created project proceeds without touching the stored doc."""
+        self.mock_ydm.ensure_project.return_value = (MagicMock(), True)
+
+        self.project.initialize_project_in_db()
+
+        self.mock_ydm.ensure_project.assert_called_once_with(
+            "P12345",
+            "ref_12345",
+            "Test Project",
+            "10X",
+            self.project.user_info,
+            True,
+        )
+        self.assertTrue(self.project.proceed)
+        self.mock_ydm.save_document.assert_not_called()
+
+    def test_initialize_project_exists_completed(self):
+        """Test an existing completed project is skipped and not re-synced."""
+        document = self._stored_document("completed")
+        self.mock_ydm.ensure_project.return_value = (document, False)
+
+        self.project.initialize_project_in_db()
+
+        self.assertFalse(self.project.proceed)
+        self.assertEqual(self.project.project_status, "completed")
+        document.sync_project_metadata.assert_not_called()
+
+    def test_initialize_project_exists_ongoing(self):
+        """Test an existing ongoing project proceeds and syncs its metadata."""
+        document = self._stored_document("ongoing")
+        self.mock_ydm.ensure_project.return_value = (document, False)
+
+        self.project.initialize_project_in_db()
+
+        self.assertTrue(self.project.proceed)
+        self.assertEqual(self.project.project_status, "ongoing")
+        document.sync_project_metadata.assert_called_once_with(
+            user_info=self.project.user_info, is_sensitive=True
+        )
+        self.mock_ydm.save_document.assert_called_with(document)
+
+    @patch("lib.base.abstract_project.logging")
+    def test_initialize_project_db_error(self, mock_logging):
+        """Test the project does not proceed when ensure_project fails."""
+        self.mock_ydm.ensure_project.return_value = (None, False)
+
+        self.project.initialize_project_in_db()
+
+        self.assertFalse(self.project.proceed)
+        self.mock_ydm.save_document.assert_not_called()
+        mock_logging.error.assert_called_once_with(
+            "Could not fetch YggdrasilDocument for P12345."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
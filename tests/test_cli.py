@@ -79,8 +79,12 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run") as mock_asyncio_run,
+            patch("asyncio.Runner") as mock_runner_cls,
+            patch(
+                "yggdrasil.cli.Ygg.get_loop_factory", return_value=Mock()
+            ) as mock_get_loop_factory,
         ):
+            mock_runner_run = mock_runner_cls.return_value.__enter__.return_value.run
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core = Mock()
@@ -91,7 +95,10 @@ class TestYggdrasilCLI(unittest.TestCase):
             # Verify daemon mode was processed correctly
             mock_core.setup_handlers.assert_called_once()
             mock_core.setup_watchers.assert_called_once()
-            mock_asyncio_run.assert_called_once_with(mock_core.start())
+            mock_runner_cls.assert_called_once_with(
+                loop_factory=mock_get_loop_factory.return_value
+            )
+            mock_runner_run.assert_called_once_with(mock_core.start())
 
     def test_daemon_mode_with_dev_flag(self):
         """Test daemon mode with development flag."""
@@ -101,7 +108,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
             patch("yggdrasil.cli.YggSession") as mock_session,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
@@ -202,7 +209,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             patch("yggdrasil.cli.configure_logging") as mock_configure_logging,
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core_class.return_value = Mock()
@@ -220,7 +227,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             patch("yggdrasil.cli.configure_logging") as mock_configure_logging,
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core_class.return_value = Mock()
@@ -238,7 +245,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             patch("yggdrasil.cli.configure_logging") as mock_configure_logging,
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core_class.return_value = Mock()
@@ -259,7 +266,7 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
 
             mock_config_loader_instance = Mock()
@@ -283,7 +290,7 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
@@ -326,8 +333,9 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run") as mock_asyncio_run,
+            patch("asyncio.Runner") as mock_runner_cls,
         ):
+            mock_runner_run = mock_runner_cls.return_value.__enter__.return_value.run
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core = Mock()
@@ -338,7 +346,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             # Verify complete daemon setup flow
             mock_core.setup_handlers.assert_called_once()
             mock_core.setup_watchers.assert_called_once()
-            mock_asyncio_run.assert_called_once_with(mock_core.start())
+            mock_runner_run.assert_called_once_with(mock_core.start())
 
     def test_daemon_mode_keyboard_interrupt(self):
         """Test daemon mode handling of KeyboardInterrupt."""
@@ -347,21 +355,22 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run") as mock_asyncio_run,
+            patch("asyncio.Runner") as mock_runner_cls,
         ):
+            mock_runner_run = mock_runner_cls.return_value.__enter__.return_value.run
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core = Mock()
             mock_core_class.return_value = mock_core
 
             # First call (start) raises KeyboardInterrupt, second call (stop) succeeds
-            mock_asyncio_run.side_effect = [KeyboardInterrupt(), None]
+            mock_runner_run.side_effect = [KeyboardInterrupt(), None]
 
             main()
 
             # Verify both start and stop were called
             expected_calls = [call(mock_core.start()), call(mock_core.stop())]
-            mock_asyncio_run.assert_has_calls(expected_calls)
+            mock_runner_run.assert_has_calls(expected_calls)
 
     # =====================================================
     # RUN-DOC MODE TESTS
@@ -474,12 +483,13 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run") as mock_asyncio_run,
+            patch("asyncio.Runner") as mock_runner_cls,
         ):
+            mock_runner_run = mock_runner_cls.return_value.__enter__.return_value.run
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core_class.return_value = Mock()
-            mock_asyncio_run.side_effect = Exception("Asyncio error")
+            mock_runner_run.side_effect = Exception("Asyncio error")
 
             with self.assertRaises(Exception) as context:
                 main()
@@ -499,7 +509,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             patch("yggdrasil.cli.custom_logger") as mock_custom_logger,
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
             mock_config_loader.return_value.load_config.return_value = self.mock_config
             mock_core_class.return_value = Mock()
@@ -522,7 +532,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
             patch("yggdrasil.cli.YggSession") as mock_session,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
@@ -575,7 +585,7 @@ class TestYggdrasilCLI(unittest.TestCase):
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
             patch("yggdrasil.cli.YggSession") as mock_session,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
@@ -705,7 +715,7 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
@@ -730,7 +740,7 @@ class TestYggdrasilCLI(unittest.TestCase):
         with (
             patch("yggdrasil.cli.ConfigLoader") as mock_config_loader,
             patch("yggdrasil.cli.YggdrasilCore") as mock_core_class,
-            patch("asyncio.run"),
+            patch("asyncio.Runner"),
         ):
 
             mock_config_loader.return_value.load_config.return_value = self.mock_config
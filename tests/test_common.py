@@ -1,4 +1,5 @@
 import os
+import sys
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
@@ -243,6 +244,18 @@ class TestYggdrasilUtilities(unittest.TestCase):
             result = YggdrasilUtilities.get_path("somefile")
             self.assertIsNone(result)
 
+    def test_get_loop_factory_with_uvloop(self):
+        mock_uvloop = MagicMock()
+        with patch.dict(sys.modules, {"uvloop": mock_uvloop}):
+            result = YggdrasilUtilities.get_loop_factory()
+        self.assertIs(result, mock_uvloop.new_event_loop)
+
+    def test_get_loop_factory_without_uvloop(self):
+        # A None entry in sys.modules makes the import raise ImportError
+        with patch.dict(sys.modules, {"uvloop": None}):
+            result = YggdrasilUtilities.get_loop_factory()
+        self.assertIsNone(result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,25 +1,10 @@
 import os
-import sys
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import Mock, call, patch
 
+# Install the shared IBM Cloud SDK stubs before importing the module under test
+from tests.sdk_stubs import MockApiException  # isort: skip
 
-# Create mocks for IBM Cloud SDK classes
-class MockApiException(Exception):
-    def __init__(self, message, code=None):
-        super().__init__(message)
-        self.code = code
-
-
-# Mock the IBM Cloud SDK modules to avoid import errors in test environment
-mock_api_exception_module = MagicMock()
-mock_api_exception_module.ApiException = MockApiException
-sys.modules["ibm_cloud_sdk_core"] = MagicMock()
-sys.modules["ibm_cloud_sdk_core.api_exception"] = mock_api_exception_module
-sys.modules["ibmcloudant"] = MagicMock()
-sys.modules["ibmcloudant.cloudant_v1"] = MagicMock()
-
-# Also make the ApiException available in the connection module
 import lib.couchdb.couchdb_connection
 
 # Import the modules AFTER setting up the mocks
@@ -32,8 +17,8 @@ lib.couchdb.couchdb_connection.ApiException = MockApiException
 class TestCouchDBConnectionManager(unittest.TestCase):
     def setUp(self):
         # Clear singleton instances to ensure test isolation
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
+        SingletonMeta._instances.pop(CouchDBConnectionManager, None)
+        self.addCleanup(SingletonMeta._instances.pop, CouchDBConnectionManager, None)
 
         # Common configuration that will be returned by ConfigLoader.load_config
         self.mock_config = {
@@ -44,11 +29,6 @@ class TestCouchDBConnectionManager(unittest.TestCase):
             }
         }
 
-    def tearDown(self):
-        # Clear singleton instances after each test
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
-
     @patch("lib.couchdb.couchdb_connection.ConfigLoader")
     @patch("lib.couchdb.couchdb_connection.os.getenv")
     @patch("lib.couchdb.couchdb_connection.cloudant_v1.CloudantV1")
@@ -72,7 +52,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
         mock_getenv.side_effect = getenv_side_effect
 
         # Mock a successful server connection
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -93,7 +73,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
     @patch("lib.couchdb.couchdb_connection.CouchDbSessionAuthenticator")
     def test_singleton_returns_same_instance(self, mock_auth, mock_cloudant):
         # First instantiation
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -133,7 +113,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
         """Test successful database verification with ensure_db."""
         # Configure getenv mock to return default values (handle 1 or 2 args)
         mock_getenv.side_effect = lambda key, default=None: default
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -172,7 +152,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
         # Create a proper ApiException mock
         api_exception = MockApiException("Not Found", code=404)
 
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -214,7 +194,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
         # Create a proper ApiException mock with different error code
         api_exception = MockApiException("Internal Server Error", code=500)
 
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -248,7 +228,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
     ):
         """Test ensure_db when server is not connected."""
         mock_getenv.side_effect = lambda key, default=None: default
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -281,7 +261,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
     ):
         """Test ensure_db called multiple times with the same database name."""
         mock_getenv.side_effect = lambda key, default=None: default
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -321,7 +301,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
     ):
         """Test ensure_db with different database names."""
         mock_getenv.side_effect = lambda key, default=None: default
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -374,7 +354,7 @@ class TestCouchDBConnectionManager(unittest.TestCase):
 
         mock_getenv.side_effect = getenv_side_effect
 
-        mock_server = MagicMock()
+        mock_server = Mock()
         mock_server.get_server_information.return_value.get_result.return_value = {
             "version": "3.1.1"
         }
@@ -1,8 +1,12 @@
+import asyncio
 import json
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
 from lib.core_utils.singleton_decorator import SingletonMeta
+from lib.couchdb.couchdb_connection import CouchDBConnectionManager
 from lib.couchdb.project_db_manager import ProjectDBManager
 
 
@@ -21,70 +25,67 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
     Tests initialization, async change fetching, document retrieval, and error handling.
     """
 
+    # Read-only fixture data, built once for the class rather than per test
+    mock_module_registry = {
+        "10X": {"module": "lib.realms.tenx.tenx_project.TenXProject"},
+        "Smart-seq3": {
+            "module": "lib.realms.smartseq3.smartseq3_project.SmartSeq3Project"
+        },
+        "MARS": {
+            "module": "lib.realms.mars.mars_project.MarsProject",
+            "prefix": True,
+        },
+    }
+
+    # Mock database documents
+    mock_doc_with_10x = {
+        "_id": "doc1",
+        "project_id": "P12345",
+        "details": {"library_construction_method": "10X"},
+    }
+
+    mock_doc_with_smartseq = {
+        "_id": "doc2",
+        "project_id": "P12346",
+        "details": {"library_construction_method": "Smart-seq3"},
+    }
+
+    mock_doc_with_prefix_match = {
+        "_id": "doc3",
+        "project_id": "P12347",
+        "details": {"library_construction_method": "MARS-seq"},
+    }
+
+    mock_doc_with_unknown_method = {
+        "_id": "doc4",
+        "project_id": "P12348",
+        "details": {"library_construction_method": "UnknownMethod"},
+    }
+
+    mock_doc_missing_details = {"_id": "doc5", "project_id": "P12349"}
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch CouchDBHandler.__init__ once for the whole class."""
+        patcher = patch(
+            "lib.couchdb.project_db_manager.CouchDBHandler.__init__",
+            return_value=None,
+        )
+        cls.mock_handler_init = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
         """Set up test fixtures and clear singleton instances for test isolation."""
+        self.mock_handler_init.reset_mock()
+
         # Clear singleton instances to ensure test isolation
-        from lib.couchdb.couchdb_connection import CouchDBConnectionManager
-
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
-
-        # Mock module registry data
-        self.mock_module_registry = {
-            "10X": {"module": "lib.realms.tenx.tenx_project.TenXProject"},
-            "Smart-seq3": {
-                "module": "lib.realms.smartseq3.smartseq3_project.SmartSeq3Project"
-            },
-            "MARS": {
-                "module": "lib.realms.mars.mars_project.MarsProject",
-                "prefix": True,
-            },
-        }
-
-        # Mock database documents
-        self.mock_doc_with_10x = {
-            "_id": "doc1",
-            "project_id": "P12345",
-            "details": {"library_construction_method": "10X"},
-        }
-
-        self.mock_doc_with_smartseq = {
-            "_id": "doc2",
-            "project_id": "P12346",
-            "details": {"library_construction_method": "Smart-seq3"},
-        }
-
-        self.mock_doc_with_prefix_match = {
-            "_id": "doc3",
-            "project_id": "P12347",
-            "details": {"library_construction_method": "MARS-seq"},
-        }
-
-        self.mock_doc_with_unknown_method = {
-            "_id": "doc4",
-            "project_id": "P12348",
-            "details": {"library_construction_method": "UnknownMethod"},
-        }
-
-        self.mock_doc_missing_details = {"_id": "doc5", "project_id": "P12349"}
-
-        # Mock IBM Cloud SDK responses
-        self.mock_changes_response = MagicMock()
-        self.mock_document_response = MagicMock()
-
-    def tearDown(self):
-        """Clean up singleton instances after each test."""
-        from lib.couchdb.couchdb_connection import CouchDBConnectionManager
-
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
+        SingletonMeta._instances.pop(CouchDBConnectionManager, None)
+        self.addCleanup(SingletonMeta._instances.pop, CouchDBConnectionManager, None)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_init_success(self, mock_handler_init, mock_config_loader):
+    def test_init_success(self, mock_config_loader):
         """Test successful initialization of ProjectDBManager."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -93,16 +94,14 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         manager = ProjectDBManager()
 
         # Assert
-        mock_handler_init.assert_called_once_with("projects")
+        self.mock_handler_init.assert_called_once_with("projects")
         mock_config_instance.load_config.assert_called_once_with("module_registry.json")
         self.assertEqual(manager.module_registry, self.mock_module_registry)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_init_config_loading_error(self, mock_handler_init, mock_config_loader):
+    def test_init_config_loading_error(self, mock_config_loader):
         """Test initialization when module registry loading fails."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.side_effect = Exception("Config error")
         mock_config_loader.return_value = mock_config_instance
@@ -112,13 +111,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
             ProjectDBManager()
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    async def test_fetch_changes_exact_match(
-        self, mock_handler_init, mock_config_loader
-    ):
+    async def test_fetch_changes_exact_match(self, mock_config_loader):
         """Test fetch_changes with exact module registry match."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -144,13 +139,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(module_loc, "lib.realms.tenx.tenx_project.TenXProject")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    async def test_fetch_changes_prefix_match(
-        self, mock_handler_init, mock_config_loader
-    ):
+    async def test_fetch_changes_prefix_match(self, mock_config_loader):
         """Test fetch_changes with prefix matching when exact match fails."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -176,11 +167,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(module_loc, "lib.realms.mars.mars_project.MarsProject")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_fetch_changes_no_match_logic(self, mock_handler_init, mock_config_loader):
+    def test_fetch_changes_no_match_logic(self, mock_config_loader):
         """Test the logic used in fetch_changes when no module registry match is found."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -205,13 +194,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(found_prefix_match)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_fetch_changes_missing_details_logic(
-        self, mock_handler_init, mock_config_loader
-    ):
+    def test_fetch_changes_missing_details_logic(self, mock_config_loader):
         """Test the exception handling when document is missing details/method."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -226,15 +211,13 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         # (this simulates what happens in fetch_changes)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.Ygg.get_last_processed_seq")
     @patch("lib.couchdb.project_db_manager.Ygg.save_last_processed_seq")
     async def test_get_changes_success(
-        self, mock_save_seq, mock_get_seq, mock_handler_init, mock_config_loader
+        self, mock_save_seq, mock_get_seq, mock_config_loader
     ):
         """Test get_changes successfully fetches and yields documents."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -279,7 +262,11 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
 
         # Verify IBM SDK calls
         mock_server.post_changes_as_stream.assert_called_once_with(
-            db="projects", feed="continuous", since="0", include_docs=False
+            db="projects",
+            feed="continuous",
+            since="0",
+            include_docs=True,
+            heartbeat=ProjectDBManager.CHANGES_HEARTBEAT_MS,
         )
 
         # Verify sequence tracking
@@ -288,14 +275,12 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         mock_save_seq.assert_any_call("2")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.Ygg.get_last_processed_seq")
     async def test_get_changes_with_provided_seq(
-        self, mock_get_seq, mock_handler_init, mock_config_loader
+        self, mock_get_seq, mock_config_loader
     ):
         """Test get_changes when last_processed_seq is provided."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -328,11 +313,14 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         # Should not call get_last_processed_seq when seq is provided
         mock_get_seq.assert_not_called()
         mock_server.post_changes_as_stream.assert_called_once_with(
-            db="projects", feed="continuous", since="custom_seq", include_docs=False
+            db="projects",
+            feed="continuous",
+            since="custom_seq",
+            include_docs=True,
+            heartbeat=ProjectDBManager.CHANGES_HEARTBEAT_MS,
         )
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.Ygg.get_last_processed_seq")
     @patch("lib.couchdb.project_db_manager.Ygg.save_last_processed_seq")
     @patch("lib.couchdb.project_db_manager.logging")
@@ -341,12 +329,10 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         mock_logging,
         mock_save_seq,
         mock_get_seq,
-        mock_handler_init,
         mock_config_loader,
     ):
         """Test get_changes when fetch_document_by_id returns None."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -387,7 +373,6 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         mock_save_seq.assert_called_once_with("1")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.Ygg.get_last_processed_seq")
     @patch("lib.couchdb.project_db_manager.Ygg.save_last_processed_seq")
     @patch("lib.couchdb.project_db_manager.logging")
@@ -396,12 +381,10 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         mock_logging,
         mock_save_seq,
         mock_get_seq,
-        mock_handler_init,
         mock_config_loader,
     ):
         """Test get_changes when sequence is None."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -441,15 +424,13 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         mock_save_seq.assert_not_called()
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.Ygg.get_last_processed_seq")
     @patch("lib.couchdb.project_db_manager.logging")
     async def test_get_changes_fetch_document_exception(
-        self, mock_logging, mock_get_seq, mock_handler_init, mock_config_loader
+        self, mock_logging, mock_get_seq, mock_config_loader
     ):
         """Test get_changes when fetch_document_by_id raises exceptions."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -495,13 +476,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         mock_logging.debug.assert_called_with(f"Data causing the error: {mock_change}")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    async def test_get_changes_skip_empty_lines(
-        self, mock_handler_init, mock_config_loader
-    ):
+    async def test_get_changes_skip_empty_lines(self, mock_config_loader):
         """Test get_changes skips empty lines in changes stream."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -536,13 +513,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(results[0], self.mock_doc_with_10x)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    async def test_get_changes_skip_invalid_json(
-        self, mock_handler_init, mock_config_loader
-    ):
+    async def test_get_changes_skip_invalid_json(self, mock_config_loader):
         """Test get_changes handles invalid JSON lines gracefully."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -580,13 +553,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(results), 0)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    async def test_get_changes_skip_incomplete_changes(
-        self, mock_handler_init, mock_config_loader
-    ):
+    async def test_get_changes_skip_incomplete_changes(self, mock_config_loader):
         """Test get_changes skips changes without id or seq."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -625,11 +594,127 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         manager.fetch_document_by_id.assert_called_once_with("doc2")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_fetch_document_by_id_success(self, mock_handler_init, mock_config_loader):
+    @patch("lib.couchdb.project_db_manager.Ygg.save_last_processed_seq")
+    async def test_get_changes_uses_included_docs(
+        self, mock_save_seq, mock_config_loader
+    ):
+        """Test get_changes yields docs carried by the feed without fetching them."""
+        # Arrange
+        mock_config_instance = MagicMock()
+        mock_config_instance.load_config.return_value = self.mock_module_registry
+        mock_config_loader.return_value = mock_config_instance
+
+        manager = ProjectDBManager()
+
+        mock_server = MagicMock()
+        manager.server = mock_server
+        manager.db_name = "projects"
+
+        mock_stream_response = MagicMock()
+        mock_stream_response.iter_lines.return_value = [
+            json.dumps({"id": "doc1", "seq": "1", "doc": self.mock_doc_with_10x}),
+            json.dumps({"id": "doc9", "seq": "2", "deleted": True, "doc": {}}),
+            json.dumps({"id": "doc2", "seq": "3", "doc": self.mock_doc_with_smartseq}),
+        ]
+        mock_server.post_changes_as_stream.return_value.get_result.return_value = (
+            mock_stream_response
+        )
+        manager.fetch_document_by_id = MagicMock()
+
+        # Act
+        results = [doc async for doc in manager.get_changes(last_processed_seq="0")]
+
+        # Assert - the deleted doc is skipped and nothing is fetched separately
+        self.assertEqual(results, [self.mock_doc_with_10x, self.mock_doc_with_smartseq])
+        manager.fetch_document_by_id.assert_not_called()
+        self.assertEqual(mock_save_seq.call_count, 3)
+
+    @patch("lib.couchdb.project_db_manager.ConfigLoader")
+    @patch("lib.couchdb.project_db_manager.Ygg.save_last_processed_seq")
+    async def test_get_changes_does_not_block_loop(
+        self, mock_save_seq, mock_config_loader
+    ):
+        """Test other tasks keep running while get_changes waits on the stream."""
+        # Arrange
+        mock_config_instance = MagicMock()
+        mock_config_instance.load_config.return_value = self.mock_module_registry
+        mock_config_loader.return_value = mock_config_instance
+
+        manager = ProjectDBManager()
+
+        mock_server = MagicMock()
+        manager.server = mock_server
+        manager.db_name = "projects"
+
+        # The stream only delivers a line once another task has run
+        other_task_ran = threading.Event()
+        ran_while_waiting = []
+
+        def quiet_feed():
+            ran_while_waiting.append(other_task_ran.wait(timeout=5))
+            yield json.dumps({"id": "doc1", "seq": "1", "doc": self.mock_doc_with_10x})
+
+        mock_stream_response = MagicMock()
+        mock_stream_response.iter_lines.return_value = quiet_feed()
+        mock_server.post_changes_as_stream.return_value.get_result.return_value = (
+            mock_stream_response
+        )
+
+        async def other_task():
+            other_task_ran.set()
+
+        # Act
+        task = asyncio.create_task(other_task())
+        results = [doc async for doc in manager.get_changes(last_processed_seq="0")]
+        await task
+
+        # Assert - the other task ran before the stream produced its line
+        self.assertEqual(ran_while_waiting, [True])
+        self.assertEqual(results, [self.mock_doc_with_10x])
+
+    @patch("lib.couchdb.project_db_manager.ConfigLoader")
+    async def test_get_changes_closes_stream_on_cancel(self, mock_config_loader):
+        """Test cancelling the reader closes the changes stream."""
+        # Arrange
+        mock_config_instance = MagicMock()
+        mock_config_instance.load_config.return_value = self.mock_module_registry
+        mock_config_loader.return_value = mock_config_instance
+
+        manager = ProjectDBManager()
+
+        mock_server = MagicMock()
+        manager.server = mock_server
+        manager.db_name = "projects"
+
+        def heartbeat_feed():
+            while True:
+                time.sleep(0.01)
+                yield b""
+
+        mock_stream_response = MagicMock()
+        mock_stream_response.iter_lines.return_value = heartbeat_feed()
+        mock_server.post_changes_as_stream.return_value.get_result.return_value = (
+            mock_stream_response
+        )
+
+        async def read_changes():
+            async for _ in manager.get_changes(last_processed_seq="0"):
+                pass
+
+        # Act
+        task = asyncio.create_task(read_changes())
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        # Assert
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        mock_stream_response.close.assert_called_once()
+
+    @patch("lib.couchdb.project_db_manager.ConfigLoader")
+    def test_fetch_document_by_id_success(self, mock_config_loader):
         """Test successful document retrieval by ID."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -654,14 +739,10 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         mock_server.get_document.assert_called_once_with(db="projects", doc_id="doc1")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.logging")
-    def test_fetch_document_by_id_not_found(
-        self, mock_logging, mock_handler_init, mock_config_loader
-    ):
+    def test_fetch_document_by_id_not_found(self, mock_logging, mock_config_loader):
         """Test document retrieval when document doesn't exist (404)."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -689,14 +770,10 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         )
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.logging")
-    def test_fetch_document_by_id_api_error(
-        self, mock_logging, mock_handler_init, mock_config_loader
-    ):
+    def test_fetch_document_by_id_api_error(self, mock_logging, mock_config_loader):
         """Test document retrieval when API returns other errors."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -724,14 +801,12 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         )
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
     @patch("lib.couchdb.project_db_manager.logging")
     def test_fetch_document_by_id_general_exception(
-        self, mock_logging, mock_handler_init, mock_config_loader
+        self, mock_logging, mock_config_loader
     ):
         """Test document retrieval when general exception occurs."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -756,13 +831,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         )
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_fetch_document_by_id_non_dict_response(
-        self, mock_handler_init, mock_config_loader
-    ):
+    def test_fetch_document_by_id_non_dict_response(self, mock_config_loader):
         """Test document retrieval when response is not a dictionary."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -789,13 +860,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         )
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    async def test_fetch_changes_multiple_documents(
-        self, mock_handler_init, mock_config_loader
-    ):
+    async def test_fetch_changes_multiple_documents(self, mock_config_loader):
         """Test fetch_changes with multiple documents of different types."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -837,13 +904,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(results[2][1], "lib.realms.mars.mars_project.MarsProject")
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    async def test_fetch_changes_empty_module_registry(
-        self, mock_handler_init, mock_config_loader
-    ):
+    async def test_fetch_changes_empty_module_registry(self, mock_config_loader):
         """Test fetch_changes with empty module registry."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = {}  # Empty registry
         mock_config_loader.return_value = mock_config_instance
@@ -869,13 +932,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(found_prefix_match)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_fetch_changes_module_registry_logic(
-        self, mock_handler_init, mock_config_loader
-    ):
+    def test_fetch_changes_module_registry_logic(self, mock_config_loader):
         """Test the module registry lookup logic used in fetch_changes."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
@@ -923,13 +982,9 @@ class TestProjectDBManager(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(found_prefix_match)
 
     @patch("lib.couchdb.project_db_manager.ConfigLoader")
-    @patch("lib.couchdb.project_db_manager.CouchDBHandler.__init__")
-    def test_fetch_changes_exception_handling_logic(
-        self, mock_handler_init, mock_config_loader
-    ):
+    def test_fetch_changes_exception_handling_logic(self, mock_config_loader):
         """Test the exception handling logic used in fetch_changes."""
         # Arrange
-        mock_handler_init.return_value = None
         mock_config_instance = MagicMock()
         mock_config_instance.load_config.return_value = self.mock_module_registry
         mock_config_loader.return_value = mock_config_instance
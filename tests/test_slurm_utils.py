@@ -1,4 +1,5 @@
 import unittest
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -7,6 +8,9 @@ from lib.module_utils.slurm_utils import generate_slurm_script
 
 class TestGenerateSlurmScript(unittest.TestCase):
 
+    _TEMPLATE_FPATH = "template.slurm"
+    _OUTPUT_FPATH = "output.slurm"
+
     def setUp(self):
         self.args_dict = {"job_name": "test_job", "time": "01:00:00"}
         self.template_content = (
@@ -15,43 +19,47 @@ class TestGenerateSlurmScript(unittest.TestCase):
         self.expected_script = (
             "#!/bin/bash\n#SBATCH --job-name=test_job\n#SBATCH --time=01:00:00\n"
         )
-        self.template_fpath = "template.slurm"
-        self.output_fpath = "output.slurm"
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open, read_data="")
-    def test_generate_slurm_script_file_not_found(self, mock_file, mock_path):
+        # Patch Path and open once per test instead of decorating every method
+        self._stack = ExitStack()
+        self.mock_path = self._stack.enter_context(
+            patch("lib.module_utils.slurm_utils.Path")
+        )
+        self.mock_file = self._stack.enter_context(
+            patch("builtins.open", new_callable=mock_open)
+        )
+
+    def tearDown(self):
+        self._stack.close()
+
+    def test_generate_slurm_script_file_not_found(self):
         # Simulate FileNotFoundError when opening the template file
         mock_template_path = MagicMock()
         mock_template_path.open.side_effect = FileNotFoundError(
             "Template file not found"
         )
-        mock_path.return_value = mock_template_path
+        self.mock_path.return_value = mock_template_path
 
         result = generate_slurm_script(
-            self.args_dict, self.template_fpath, self.output_fpath
+            self.args_dict, self._TEMPLATE_FPATH, self._OUTPUT_FPATH
         )
         self.assertFalse(result)
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open, read_data="")
-    def test_generate_slurm_script_missing_placeholder(self, mock_file, mock_path):
+    def test_generate_slurm_script_missing_placeholder(self):
         # Simulate KeyError due to missing placeholder in args_dict
         incomplete_args_dict = {"job_name": "test_job"}  # Missing 'time' key
         mock_template_path = MagicMock()
         mock_template_path.open.return_value.__enter__.return_value.read.return_value = (
             self.template_content
         )
-        mock_path.return_value = mock_template_path
+        self.mock_path.return_value = mock_template_path
 
         result = generate_slurm_script(
-            incomplete_args_dict, self.template_fpath, self.output_fpath
+            incomplete_args_dict, self._TEMPLATE_FPATH, self._OUTPUT_FPATH
         )
         self.assertFalse(result)
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_success(self, mock_file, mock_path):
+    def test_generate_slurm_script_success(self):
         # Mock reading the template file and writing the output file
         mock_template_file = mock_open(read_data=self.template_content).return_value
         mock_output_file = mock_open().return_value
@@ -64,25 +72,23 @@ class TestGenerateSlurmScript(unittest.TestCase):
 
         # Mock Path objects
         def side_effect(arg):
-            if arg == self.template_fpath:
+            if arg == self._TEMPLATE_FPATH:
                 return mock_template_path
-            elif arg == self.output_fpath:
+            elif arg == self._OUTPUT_FPATH:
                 return mock_output_path
             else:
                 return Path(arg)
 
-        mock_path.side_effect = side_effect
+        self.mock_path.side_effect = side_effect
 
         result = generate_slurm_script(
-            self.args_dict, self.template_fpath, self.output_fpath
+            self.args_dict, self._TEMPLATE_FPATH, self._OUTPUT_FPATH
         )
         self.assertTrue(result)
         mock_template_file.read.assert_called_once()
         mock_output_file.write.assert_called_once_with(self.expected_script)
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_general_exception(self, mock_file, mock_path):
+    def test_generate_slurm_script_general_exception(self):
         # Simulate a general exception during file writing
         mock_template_file = mock_open(read_data=self.template_content).return_value
         mock_output_file = mock_open().return_value
@@ -96,23 +102,21 @@ class TestGenerateSlurmScript(unittest.TestCase):
 
         # Mock Path objects
         def side_effect(arg):
-            if arg == self.template_fpath:
+            if arg == self._TEMPLATE_FPATH:
                 return mock_template_path
-            elif arg == self.output_fpath:
+            elif arg == self._OUTPUT_FPATH:
                 return mock_output_path
             else:
                 return Path(arg)
 
-        mock_path.side_effect = side_effect
+        self.mock_path.side_effect = side_effect
 
         result = generate_slurm_script(
-            self.args_dict, self.template_fpath, self.output_fpath
+            self.args_dict, self._TEMPLATE_FPATH, self._OUTPUT_FPATH
         )
         self.assertFalse(result)
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_empty_template(self, mock_file, mock_path):
+    def test_generate_slurm_script_empty_template(self):
         # Test with an empty template
         empty_template_content = ""
         mock_template_file = mock_open(read_data=empty_template_content).return_value
@@ -125,17 +129,15 @@ class TestGenerateSlurmScript(unittest.TestCase):
         mock_output_path.open.return_value = mock_output_file
 
         # Mock Path objects
-        mock_path.side_effect = lambda arg: (
-            mock_template_path if arg == self.template_fpath else mock_output_path
+        self.mock_path.side_effect = lambda arg: (
+            mock_template_path if arg == self._TEMPLATE_FPATH else mock_output_path
         )
 
-        result = generate_slurm_script({}, self.template_fpath, self.output_fpath)
+        result = generate_slurm_script({}, self._TEMPLATE_FPATH, self._OUTPUT_FPATH)
         self.assertTrue(result)
         mock_output_file.write.assert_called_once_with("")
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_empty_args_dict(self, mock_file, mock_path):
+    def test_generate_slurm_script_empty_args_dict(self):
         # Test with empty args_dict but placeholders in template
         mock_template_file = mock_open(read_data=self.template_content).return_value
         mock_output_file = mock_open().return_value
@@ -146,16 +148,14 @@ class TestGenerateSlurmScript(unittest.TestCase):
         mock_output_path = MagicMock(spec=Path)
         mock_output_path.open.return_value = mock_output_file
 
-        mock_path.side_effect = lambda arg: (
-            mock_template_path if arg == self.template_fpath else mock_output_path
+        self.mock_path.side_effect = lambda arg: (
+            mock_template_path if arg == self._TEMPLATE_FPATH else mock_output_path
         )
 
-        result = generate_slurm_script({}, self.template_fpath, self.output_fpath)
+        result = generate_slurm_script({}, self._TEMPLATE_FPATH, self._OUTPUT_FPATH)
         self.assertFalse(result)
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_output_file_unwritable(self, mock_file, mock_path):
+    def test_generate_slurm_script_output_file_unwritable(self):
         # Simulate exception when opening output file for writing
         mock_template_file = mock_open(read_data=self.template_content).return_value
 
@@ -168,18 +168,16 @@ class TestGenerateSlurmScript(unittest.TestCase):
         )
 
         # Mock Path objects
-        mock_path.side_effect = lambda arg: (
-            mock_template_path if arg == self.template_fpath else mock_output_path
+        self.mock_path.side_effect = lambda arg: (
+            mock_template_path if arg == self._TEMPLATE_FPATH else mock_output_path
         )
 
         result = generate_slurm_script(
-            self.args_dict, self.template_fpath, self.output_fpath
+            self.args_dict, self._TEMPLATE_FPATH, self._OUTPUT_FPATH
         )
         self.assertFalse(result)
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_non_string_args(self, mock_file, mock_path):
+    def test_generate_slurm_script_non_string_args(self):
         # Test with non-string values in args_dict
         args_dict = {"job_name": "test_job", "nodes": 4, "time": "01:00:00"}
         template_content = "#!/bin/bash\n#SBATCH --job-name={job_name}\n#SBATCH --nodes={nodes}\n#SBATCH --time={time}\n"
@@ -195,19 +193,17 @@ class TestGenerateSlurmScript(unittest.TestCase):
         mock_output_path.open.return_value = mock_output_file
 
         # Mock Path objects
-        mock_path.side_effect = lambda arg: (
-            mock_template_path if arg == self.template_fpath else mock_output_path
+        self.mock_path.side_effect = lambda arg: (
+            mock_template_path if arg == self._TEMPLATE_FPATH else mock_output_path
         )
 
         result = generate_slurm_script(
-            args_dict, self.template_fpath, self.output_fpath
+            args_dict, self._TEMPLATE_FPATH, self._OUTPUT_FPATH
         )
         self.assertTrue(result)
         mock_output_file.write.assert_called_once_with(expected_script)
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_template_syntax_error(self, mock_file, mock_path):
+    def test_generate_slurm_script_template_syntax_error(self):
         # Simulate ValueError due to invalid template syntax
         invalid_template_content = "#!/bin/bash\n#SBATCH --job-name={job_name\n"
 
@@ -220,28 +216,26 @@ class TestGenerateSlurmScript(unittest.TestCase):
         mock_output_path = MagicMock(spec=Path)
         mock_output_path.open.return_value = mock_output_file
 
-        mock_path.side_effect = lambda arg: (
-            mock_template_path if arg == self.template_fpath else mock_output_path
+        self.mock_path.side_effect = lambda arg: (
+            mock_template_path if arg == self._TEMPLATE_FPATH else mock_output_path
         )
 
         result = generate_slurm_script(
-            self.args_dict, self.template_fpath, self.output_fpath
+            self.args_dict, self._TEMPLATE_FPATH, self._OUTPUT_FPATH
         )
         self.assertFalse(result)
 
     def test_generate_slurm_script_invalid_template_path_type(self):
         # Test with invalid type for template_fpath
         with self.assertRaises(TypeError):
-            generate_slurm_script(self.args_dict, None, self.output_fpath)  # type: ignore
+            generate_slurm_script(self.args_dict, None, self._OUTPUT_FPATH)  # type: ignore
 
     def test_generate_slurm_script_invalid_output_path_type(self):
         # Test with invalid type for output_fpath
         with self.assertRaises(TypeError):
-            generate_slurm_script(self.args_dict, self.template_fpath, None)  # type: ignore
+            generate_slurm_script(self.args_dict, self._TEMPLATE_FPATH, None)  # type: ignore
 
-    @patch("lib.module_utils.slurm_utils.Path")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_generate_slurm_script_no_placeholders(self, mock_file, mock_path):
+    def test_generate_slurm_script_no_placeholders(self):
         # Test template with no placeholders
         template_content = "#!/bin/bash\n#SBATCH --partition=general\n"
         expected_script = template_content
@@ -255,11 +249,11 @@ class TestGenerateSlurmScript(unittest.TestCase):
         mock_output_path = MagicMock(spec=Path)
         mock_output_path.open.return_value = mock_output_file
 
-        mock_path.side_effect = lambda arg: (
-            mock_template_path if arg == self.template_fpath else mock_output_path
+        self.mock_path.side_effect = lambda arg: (
+            mock_template_path if arg == self._TEMPLATE_FPATH else mock_output_path
         )
 
-        result = generate_slurm_script({}, self.template_fpath, self.output_fpath)
+        result = generate_slurm_script({}, self._TEMPLATE_FPATH, self._OUTPUT_FPATH)
         self.assertTrue(result)
         mock_output_file.write.assert_called_once_with(expected_script)
 
@@ -1,13 +1,103 @@
 import asyncio
-import logging
+import importlib.metadata
+import re
+import subprocess
+import sys
 import unittest
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, Mock, call, patch
 
+from lib.core_utils import yggdrasil_core
 from lib.core_utils.event_types import EventType
 from lib.core_utils.singleton_decorator import SingletonMeta
 from lib.core_utils.yggdrasil_core import YggdrasilCore
-from lib.watchers.couchdb_watcher import CouchDBWatcher
-from lib.watchers.seq_data_watcher import SeqDataWatcher, YggdrasilEvent
+from lib.watchers.abstract_watcher import YggdrasilEvent
+
+try:
+    # Either the real SDK or the stubs another test module installed
+    import ibmcloudant.cloudant_v1  # noqa: F401
+except ImportError:
+    _HAVE_CLOUDANT = False
+else:
+    _HAVE_CLOUDANT = True
+
+PROJECT_CHANGE = EventType.PROJECT_CHANGE
+FLOWCELL_READY = EventType.FLOWCELL_READY
+DELIVERY_READY = EventType.DELIVERY_READY
+
+# Immutable fixtures shared by every test in this module
+TEST_CONFIG = MappingProxyType(
+    {
+        "instrument_watch": [
+            {
+                "name": "TestInstrument",
+                "directory": "/test/path",
+                "marker_files": ["test.txt"],
+            }
+        ],
+        "couchdb_poll_interval": 10,
+        "some_other_setting": "value",
+    }
+)
+
+TEST_EVENT = YggdrasilEvent(
+    event_type=PROJECT_CHANGE,
+    payload={"document": {"id": "test_doc"}},
+    source="TestSource",
+)
+
+# Log lines YggdrasilCore.handle_event emits for TEST_EVENT
+RECEIVED_MSG = f"Received event '{TEST_EVENT.event_type}' from '{TEST_EVENT.source}'"
+DISPATCH_MSG = f"Dispatching event_type='{TEST_EVENT.event_type}' to its handler."
+NO_HANDLER_MSG = f"No handler registered for event_type='{TEST_EVENT.event_type}'"
+HANDLER_ERROR_MSG = (
+    f"Error while handling event '{TEST_EVENT.event_type}': Handler failed"
+)
+
+# _setup_fs_watchers currently ignores config and watches a hardcoded MiSeq dir
+FS_WATCHER_NAME = "SeqDataWatcher-MiSeq"
+
+# Marks a handler class without an event_type attribute
+_MISSING = object()
+
+
+class _RecLogger:
+    """Minimal logger stand-in that records calls without spec introspection."""
+
+    def __init__(self):
+        self.debug = Mock()
+        self.info = Mock()
+        self.warning = Mock()
+        self.error = Mock()
+
+    def reset_mock(self):
+        for method in (self.debug, self.info, self.warning, self.error):
+            method.reset_mock()
+
+
+def _make_async_watcher(fail=False):
+    """Build a watcher stand-in with awaitable start()/stop()."""
+    watcher = Mock()
+    watcher.start = AsyncMock(side_effect=Exception("Watcher failed") if fail else None)
+    watcher.stop = AsyncMock()
+    return watcher
+
+
+# One event loop shared by all async tests in this module
+_runner: asyncio.Runner
+
+
+def setUpModule():
+    global _runner
+    _runner = asyncio.Runner()
+
+
+def tearDownModule():
+    _runner.close()
+    # Each test clears the singleton up front; only the last instance needs
+    # dropping so it does not leak into other test modules.
+    SingletonMeta._instances.clear()
 
 
 class TestYggdrasilCore(unittest.TestCase):
@@ -18,45 +108,66 @@ class TestYggdrasilCore(unittest.TestCase):
     async lifecycle, event processing, and error handling scenarios.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Patch out DB manager initialization once for the whole class."""
+        patcher = patch.object(YggdrasilCore, "_init_db_managers")
+        cls.mock_init_db = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+        # Logger reused across tests; reset rather than rebuilt in setUp
+        cls.mock_logger = _RecLogger()
+
     def setUp(self):
         """Set up test fixtures and clear singleton state."""
         # Clear singleton instance before each test
         SingletonMeta._instances.clear()
+        self.mock_init_db.reset_mock()
+        self.mock_logger.reset_mock()
 
-        # Sample configuration for testing
-        self.test_config = {
-            "instrument_watch": [
-                {
-                    "name": "TestInstrument",
-                    "directory": "/test/path",
-                    "marker_files": ["test.txt"],
-                }
-            ],
-            "couchdb_poll_interval": 10,
-            "some_other_setting": "value",
-        }
-
-        # Mock logger for testing
-        self.mock_logger = Mock(spec=logging.Logger)
-
-        # Sample event for testing
-        self.test_event = YggdrasilEvent(
-            event_type=EventType.PROJECT_CHANGE,
-            payload={"document": {"id": "test_doc"}},
-            source="TestSource",
+        self.test_config = TEST_CONFIG
+        self.test_event = TEST_EVENT
+
+    def _patch_entry_points(self, *entry_points):
+        """Make importlib.metadata.entry_points() return the given entry points."""
+        patcher = patch.object(
+            importlib.metadata, "entry_points", return_value=list(entry_points)
         )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def _patch_run_once_deps(self):
+        """Patch the ProjectDBManager and module resolver run_once imports."""
+        mocks = []
+        for target in (
+            "lib.couchdb.project_db_manager.ProjectDBManager",
+            "lib.core_utils.module_resolver.get_module_location",
+        ):
+            patcher = patch(target)
+            self.addCleanup(patcher.stop)
+            mocks.append(patcher.start())
+        return mocks
+
+    def _make_running_core(self):
+        """Build a core marked as running with two async watchers attached."""
+        core = YggdrasilCore(self.test_config, self.mock_logger)
+        core._running = True
+        core.watchers = [_make_async_watcher(), _make_async_watcher()]
+        return core
 
-    def tearDown(self):
-        """Clean up after each test."""
-        # Clear singleton state after each test
-        SingletonMeta._instances.clear()
+    def _patch_seq_data_watcher(self):
+        """Record SeqDataWatcher construction args instead of building a watcher."""
+        patcher = patch.object(
+            yggdrasil_core, "SeqDataWatcher", lambda **kw: SimpleNamespace(**kw)
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
 
     # =====================================================
     # INITIALIZATION AND SINGLETON TESTS
     # =====================================================
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_initialization_with_config_and_logger(self, mock_init_db):
+    def test_initialization_with_config_and_logger(self):
         """Test basic initialization with config and custom logger."""
         # Act
         core = YggdrasilCore(self.test_config, self.mock_logger)
@@ -68,14 +179,13 @@ class TestYggdrasilCore(unittest.TestCase):
         self.assertEqual(core.watchers, [])
         self.assertEqual(core.handlers, {})
 
-        mock_init_db.assert_called_once()
+        self.mock_init_db.assert_called_once()
         self.mock_logger.info.assert_called_with("YggdrasilCore initialized.")
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_initialization_with_default_logger(self, mock_init_db):
+    def test_initialization_with_default_logger(self):
         """Test initialization with default logger when none provided."""
         with patch("logging.getLogger") as mock_get_logger:
-            mock_default_logger = Mock(spec=logging.Logger)
+            mock_default_logger = _RecLogger()
             mock_get_logger.return_value = mock_default_logger
 
             # Act
@@ -88,79 +198,24 @@ class TestYggdrasilCore(unittest.TestCase):
 
     def test_singleton_behavior(self):
         """Test that YggdrasilCore properly implements singleton pattern."""
-        with patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers"):
-            # Act - create multiple instances
-            core1 = YggdrasilCore(self.test_config, self.mock_logger)
-            core2 = YggdrasilCore({"different": "config"}, Mock())
-
-            # Assert - should be the same instance
-            self.assertIs(core1, core2)
-            # Config should be from first instantiation
-            self.assertEqual(core2.config, self.test_config)
-            self.assertEqual(core2._logger, self.mock_logger)
-
-    @patch("lib.couchdb.yggdrasil_db_manager.YggdrasilDBManager")
-    @patch("lib.couchdb.project_db_manager.ProjectDBManager")
-    def test_init_db_managers_success(self, mock_pdm_class, mock_ydm_class):
-        """Test successful database manager initialization."""
-        # Arrange
-        mock_pdm_instance = Mock()
-        mock_ydm_instance = Mock()
-        mock_pdm_class.return_value = mock_pdm_instance
-        mock_ydm_class.return_value = mock_ydm_instance
-
-        # Act
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-
-        # Assert
-        self.assertEqual(core.pdm, mock_pdm_instance)
-        self.assertEqual(core.ydm, mock_ydm_instance)
-        mock_pdm_class.assert_called_once()
-        mock_ydm_class.assert_called_once()
+        # Act - create multiple instances
+        core1 = YggdrasilCore(self.test_config, self.mock_logger)
+        core2 = YggdrasilCore({"different": "config"}, Mock())
 
-        expected_calls = [
-            call("Initializing DB managers..."),
-            call("DB managers initialized."),
-            call("YggdrasilCore initialized."),
-        ]
-        self.mock_logger.info.assert_has_calls(expected_calls)
-
-    @patch("lib.couchdb.project_db_manager.ProjectDBManager")
-    def test_init_db_managers_exception(self, mock_pdm_class):
-        """Test database manager initialization with exception."""
-        # Arrange
-        mock_pdm_class.side_effect = Exception("DB connection failed")
-
-        # Act & Assert
-        with self.assertRaises(Exception) as context:
-            YggdrasilCore(self.test_config, self.mock_logger)
-
-        self.assertIn("DB connection failed", str(context.exception))
+        # Assert - should be the same instance
+        self.assertIs(core1, core2)
+        # Config should be from first instantiation
+        self.assertEqual(core2.config, self.test_config)
+        self.assertEqual(core2._logger, self.mock_logger)
 
     # =====================================================
     # WATCHER REGISTRATION AND SETUP TESTS
     # =====================================================
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_register_watcher(self, mock_init_db):
-        """Test watcher registration functionality."""
-        # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        mock_watcher = Mock()
-
-        # Act
-        core.register_watcher(mock_watcher)
-
-        # Assert
-        self.assertIn(mock_watcher, core.watchers)
-        self.mock_logger.debug.assert_called_with(
-            f"Registering watcher: {mock_watcher}"
-        )
-
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_setup_fs_watchers(self, mock_init_db):
+    def test_setup_fs_watchers(self):
         """Test file system watcher setup with instrument configuration."""
         # Arrange
+        self._patch_seq_data_watcher()
         core = YggdrasilCore(self.test_config, self.mock_logger)
         initial_watchers_count = len(core.watchers)
 
@@ -170,19 +225,17 @@ class TestYggdrasilCore(unittest.TestCase):
         # Assert - Check that a watcher was added
         self.assertEqual(len(core.watchers), initial_watchers_count + 1)
 
-        # Verify the watcher is a SeqDataWatcher
+        # Verify the SeqDataWatcher construction args
         added_watcher = core.watchers[-1]
-        self.assertIsInstance(added_watcher, SeqDataWatcher)
+        self.assertEqual(added_watcher.name, FS_WATCHER_NAME)
+        self.assertEqual(added_watcher.event_type, FLOWCELL_READY)
+        self.assertEqual(added_watcher.on_event, core.handle_event)
+        self.assertEqual(added_watcher.config["instrument_name"], "MiSeq")
 
-        # Verify watcher properties
-        self.assertEqual(
-            added_watcher.name, "SeqDataWatcher-MiSeq"
-        )  # From hardcoded config
-        self.assertEqual(added_watcher.event_type, EventType.FLOWCELL_READY)
-
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_setup_cdb_watchers(self, mock_init_db):
+    def test_setup_cdb_watchers(self):
         """Test CouchDB watcher setup."""
+        from lib.watchers.couchdb_watcher import CouchDBWatcher
+
         # Arrange
         core = YggdrasilCore(self.test_config, self.mock_logger)
         core.pdm = Mock()  # Mock the ProjectDBManager
@@ -201,12 +254,11 @@ class TestYggdrasilCore(unittest.TestCase):
 
         # Verify watcher properties
         self.assertEqual(added_watcher.name, "ProjectDBWatcher")
-        self.assertEqual(added_watcher.event_type, EventType.PROJECT_CHANGE)
+        self.assertEqual(added_watcher.event_type, PROJECT_CHANGE)
         self.assertEqual(added_watcher.poll_interval, 10)  # From test config
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._setup_fs_watchers")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_setup_watchers(self, mock_init_db, mock_setup_fs):
+    @patch.object(YggdrasilCore, "_setup_fs_watchers")
+    def test_setup_watchers(self, mock_setup_fs):
         """Test main setup_watchers method."""
         # Arrange
         core = YggdrasilCore(self.test_config, self.mock_logger)
@@ -223,127 +275,65 @@ class TestYggdrasilCore(unittest.TestCase):
     # HANDLER REGISTRATION AND SETUP TESTS
     # =====================================================
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_register_handler(self, mock_init_db):
-        """Test handler registration functionality."""
-        # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        mock_handler = Mock()
-
-        # Act
-        core.register_handler(EventType.PROJECT_CHANGE, mock_handler)
-
-        # Assert
-        self.assertEqual(core.handlers[EventType.PROJECT_CHANGE], mock_handler)
-        self.mock_logger.debug.assert_called_with(
-            f"Registered handler for event_type='{EventType.PROJECT_CHANGE}'"
-        )
-
-    @patch("importlib.metadata.entry_points")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_auto_register_external_handlers_success(
-        self, mock_init_db, mock_entry_points
-    ):
-        """Test successful auto-registration of external handlers."""
-        # Arrange
-        mock_handler_class = Mock()
-        mock_handler_class.event_type = EventType.DELIVERY_READY
-        mock_handler_instance = Mock()
-        mock_handler_class.return_value = mock_handler_instance
-
-        mock_entry_point = Mock()
-        mock_entry_point.name = "test_handler"
-        mock_entry_point.load.return_value = mock_handler_class
-
-        mock_entry_points.return_value = [mock_entry_point]
-
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-
-        # Act
-        core.auto_register_external_handlers()
-
-        # Assert
-        mock_entry_points.assert_called_once_with(group="ygg.handler")
-        mock_entry_point.load.assert_called_once()
-
-        # Verify that getattr was called on the handler class to get event_type
-        # and that the handler class was instantiated
-        self.assertIn(EventType.DELIVERY_READY, core.handlers)
-        self.assertEqual(core.handlers[EventType.DELIVERY_READY], mock_handler_instance)
-
-        # Check that the log message was written
-        self.mock_logger.info.assert_called_with(
-            "✓  registered external handler %s for %s",
-            "test_handler",
-            EventType.DELIVERY_READY.name,
-        )
-
-    @patch("importlib.metadata.entry_points")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_auto_register_external_handlers_invalid_event_type(
-        self, mock_init_db, mock_entry_points
-    ):
-        """Test auto-registration with invalid event type."""
-        # Arrange
-        mock_handler_class = Mock()
-        mock_handler_class.event_type = "invalid_event_type"  # Not an EventType
-
-        mock_entry_point = Mock()
-        mock_entry_point.name = "bad_handler"
-        mock_entry_point.load.return_value = mock_handler_class
-
-        mock_entry_points.return_value = [mock_entry_point]
-
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-
-        # Act
-        core.auto_register_external_handlers()
-
-        # Assert
-        self.assertEqual(len(core.handlers), 0)  # No handlers should be registered
-        self.mock_logger.error.assert_called_with(
-            "✘  %s skipped: event_type %r is not a valid EventType",
-            "bad_handler",
-            "invalid_event_type",
-        )
-
-    @patch("importlib.metadata.entry_points")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_auto_register_external_handlers_no_event_type(
-        self, mock_init_db, mock_entry_points
-    ):
-        """Test auto-registration with missing event_type attribute."""
-        # Arrange
-        mock_handler_class = Mock()
-        del mock_handler_class.event_type  # No event_type attribute
-
-        mock_entry_point = Mock()
-        mock_entry_point.name = "no_event_type_handler"
-        mock_entry_point.load.return_value = mock_handler_class
-
-        mock_entry_points.return_value = [mock_entry_point]
-
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-
-        # Act
-        core.auto_register_external_handlers()
+    def test_auto_register_external_handlers(self):
+        """Test auto-registration of external handlers by their event_type."""
+        mock_entry_points = self._patch_entry_points()
+        cases = [
+            # (entry point name, handler event_type, expect registration)
+            ("test_handler", DELIVERY_READY, True),
+            ("bad_handler", "invalid_event_type", False),  # Not an EventType
+            ("no_event_type_handler", _MISSING, False),  # No event_type attribute
+        ]
 
-        # Assert
-        self.assertEqual(len(core.handlers), 0)
-        self.mock_logger.error.assert_called_with(
-            "✘  %s skipped: event_type %r is not a valid EventType",
-            "no_event_type_handler",
-            None,
-        )
+        for name, event_type, registered in cases:
+            with self.subTest(entry_point=name):
+                # Arrange
+                SingletonMeta._instances.clear()
+                logger = self.mock_logger
+                logger.reset_mock()
+
+                mock_handler_class = Mock()
+                if event_type is _MISSING:
+                    del mock_handler_class.event_type
+                else:
+                    mock_handler_class.event_type = event_type
+                mock_handler_instance = Mock()
+                mock_handler_class.return_value = mock_handler_instance
+
+                mock_entry_point = Mock()
+                mock_entry_point.name = name
+                mock_entry_point.load.return_value = mock_handler_class
+
+                mock_entry_points.reset_mock()
+                mock_entry_points.return_value = [mock_entry_point]
+
+                core = YggdrasilCore(self.test_config, logger)
+
+                # Act
+                core.auto_register_external_handlers()
+
+                # Assert
+                mock_entry_points.assert_called_once_with(group="ygg.handler")
+                mock_entry_point.load.assert_called_once()
+
+                if registered:
+                    self.assertEqual(core.handlers, {event_type: mock_handler_instance})
+                    logger.info.assert_called_with(
+                        "✓  registered external handler %s for %s",
+                        name,
+                        event_type.name,
+                    )
+                else:
+                    self.assertEqual(len(core.handlers), 0)
+                    logger.error.assert_called_with(
+                        "✘  %s skipped: event_type %r is not a valid EventType",
+                        name,
+                        None if event_type is _MISSING else event_type,
+                    )
 
     @patch("lib.handlers.bp_analysis_handler.BestPracticeAnalysisHandler")
-    @patch(
-        "lib.core_utils.yggdrasil_core.YggdrasilCore.auto_register_external_handlers"
-    )
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_setup_handlers(
-        self, mock_init_db, mock_auto_register, mock_bp_handler_class
-    ):
+    @patch.object(YggdrasilCore, "auto_register_external_handlers")
+    def test_setup_handlers(self, mock_auto_register, mock_bp_handler_class):
         """Test complete handler setup process."""
         # Arrange
         mock_bp_handler_instance = Mock()
@@ -358,334 +348,197 @@ class TestYggdrasilCore(unittest.TestCase):
         mock_auto_register.assert_called_once()
         mock_bp_handler_class.assert_called_once()
 
-        self.assertEqual(
-            core.handlers[EventType.PROJECT_CHANGE], mock_bp_handler_instance
-        )
+        self.assertEqual(core.handlers[PROJECT_CHANGE], mock_bp_handler_instance)
 
-        expected_calls = [
-            call("Setting up event handlers..."),
-            call("Registered handlers for events: %s", EventType.PROJECT_CHANGE),
-        ]
         self.mock_logger.info.assert_called_with("Setting up event handlers...")
         self.mock_logger.debug.assert_called_with(
-            "Registered handlers for events: %s", EventType.PROJECT_CHANGE
+            "Registered handlers for events: %s", PROJECT_CHANGE
         )
 
     # =====================================================
     # ASYNC LIFECYCLE TESTS
     # =====================================================
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_start_not_running(self, mock_init_db):
+    def test_start_not_running(self):
         """Test starting watchers when not already running."""
         # Arrange
         core = YggdrasilCore(self.test_config, self.mock_logger)
 
-        mock_watcher1 = Mock()
-        mock_watcher1.start = AsyncMock()
-        mock_watcher2 = Mock()
-        mock_watcher2.start = AsyncMock()
+        mock_watcher1 = _make_async_watcher()
+        mock_watcher2 = _make_async_watcher()
 
         core.watchers = [mock_watcher1, mock_watcher2]
 
-        async def test_start():
-            # Act
-            await core.start()
-
-            # Assert
-            self.assertTrue(core._running)
-            mock_watcher1.start.assert_called_once()
-            mock_watcher2.start.assert_called_once()
-
-            expected_calls = [
-                call("Starting all watchers..."),
-                call("Running 2 watchers in parallel."),
-                call("All watchers have exited or been stopped."),
-            ]
-            self.mock_logger.info.assert_has_calls(expected_calls, any_order=True)
-
-        # Run the async test
-        asyncio.run(test_start())
-
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_start_already_running(self, mock_init_db):
-        """Test starting watchers when already running."""
-        # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        core._running = True
-
-        async def test_start():
-            # Act
-            await core.start()
-
-            # Assert
-            self.mock_logger.warning.assert_called_with(
-                "YggdrasilCore is already running."
-            )
-
-        asyncio.run(test_start())
-
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_stop_when_running(self, mock_init_db):
-        """Test stopping watchers when running."""
-        # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        core._running = True
-
-        mock_watcher1 = Mock()
-        mock_watcher1.stop = AsyncMock()
-        mock_watcher2 = Mock()
-        mock_watcher2.stop = AsyncMock()
-
-        core.watchers = [mock_watcher1, mock_watcher2]
-
-        async def test_stop():
-            # Act
-            await core.stop()
-
-            # Assert
-            self.assertFalse(core._running)
-            mock_watcher1.stop.assert_called_once()
-            mock_watcher2.stop.assert_called_once()
-
-            expected_calls = [
-                call("Stopping all watchers..."),
-                call("All watchers stopped."),
-            ]
-            self.mock_logger.info.assert_has_calls(expected_calls)
-
-        asyncio.run(test_stop())
-
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_stop_when_not_running(self, mock_init_db):
-        """Test stopping watchers when not running."""
-        # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        core._running = False
-
-        async def test_stop():
-            # Act
-            await core.stop()
-
-            # Assert
-            self.mock_logger.debug.assert_called_with(
-                "YggdrasilCore stop called, but not running."
-            )
-
-        asyncio.run(test_stop())
-
-    # =====================================================
-    # EVENT HANDLING TESTS
-    # =====================================================
-
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_handle_event_with_registered_handler(self, mock_init_db):
-        """Test event handling with registered handler."""
-        # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        mock_handler = Mock()
-        core.handlers[EventType.PROJECT_CHANGE] = mock_handler
-
         # Act
-        core.handle_event(self.test_event)
+        _runner.run(core.start())
 
         # Assert
-        mock_handler.assert_called_once_with(self.test_event.payload)
+        self.assertTrue(core._running)
+        mock_watcher1.start.assert_called_once()
+        mock_watcher2.start.assert_called_once()
 
         expected_calls = [
-            f"Received event '{self.test_event.event_type}' from '{self.test_event.source}'",
-            f"Dispatching event_type='{self.test_event.event_type}' to its handler.",
+            call("Starting all watchers..."),
+            call("Running 2 watchers in parallel."),
+            call("All watchers have exited or been stopped."),
         ]
-        self.mock_logger.info.assert_called_with(expected_calls[0])
-        self.mock_logger.debug.assert_called_with(expected_calls[1])
+        self.mock_logger.info.assert_has_calls(expected_calls, any_order=True)
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_handle_event_no_handler(self, mock_init_db):
-        """Test event handling when no handler is registered."""
+    def test_start_already_running(self):
+        """Test starting watchers when already running."""
         # Arrange
         core = YggdrasilCore(self.test_config, self.mock_logger)
+        core._running = True
 
         # Act
-        core.handle_event(self.test_event)
+        _runner.run(core.start())
 
         # Assert
-        self.mock_logger.info.assert_called_with(
-            f"Received event '{self.test_event.event_type}' from '{self.test_event.source}'"
-        )
-        self.mock_logger.warning.assert_called_with(
-            f"No handler registered for event_type='{self.test_event.event_type}'"
-        )
+        self.mock_logger.warning.assert_called_with("YggdrasilCore is already running.")
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_handle_event_handler_exception(self, mock_init_db):
-        """Test event handling when handler raises exception."""
+    def test_stop_when_running(self):
+        """Test stopping watchers when running."""
         # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        mock_handler = Mock()
-        mock_handler.side_effect = Exception("Handler failed")
-        core.handlers[EventType.PROJECT_CHANGE] = mock_handler
+        core = self._make_running_core()
+        mock_watcher1, mock_watcher2 = core.watchers
 
         # Act
-        core.handle_event(self.test_event)
+        _runner.run(core.stop())
 
         # Assert
-        mock_handler.assert_called_once_with(self.test_event.payload)
-        self.mock_logger.error.assert_called_with(
-            f"Error while handling event '{self.test_event.event_type}': Handler failed",
-            exc_info=True,
-        )
-
-    # =====================================================
-    # CLI AND RUN_ONCE TESTS
-    # =====================================================
-
-    @patch("lib.core_utils.module_resolver.get_module_location")
-    @patch("lib.couchdb.project_db_manager.ProjectDBManager")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_run_once_success(self, mock_init_db, mock_pdm_class, mock_get_module):
-        """Test successful run_once execution."""
-        # Arrange
-        mock_pdm_instance = Mock()
-        mock_doc = {"id": "test_doc", "data": "test"}
-        mock_pdm_instance.fetch_document_by_id.return_value = mock_doc
-        mock_pdm_class.return_value = mock_pdm_instance
-
-        mock_get_module.return_value = "lib.realms.test.test.Test"
-
-        mock_handler = Mock()
-        mock_handler.run_now = Mock()
-
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-        core.handlers[EventType.PROJECT_CHANGE] = mock_handler
+        self.assertFalse(core._running)
+        mock_watcher1.stop.assert_called_once()
+        mock_watcher2.stop.assert_called_once()
 
-        # Act
-        core.run_once("test_doc_id")
+        expected_calls = [
+            call("Stopping all watchers..."),
+            call("All watchers stopped."),
+        ]
+        self.mock_logger.info.assert_has_calls(expected_calls)
 
-        # Assert
-        mock_pdm_instance.fetch_document_by_id.assert_called_once_with("test_doc_id")
-        mock_get_module.assert_called_once_with(mock_doc)
-
-        expected_payload = {
-            "document": mock_doc,
-            "module_location": "lib.realms.test.test.Test",
-        }
-        mock_handler.run_now.assert_called_once_with(expected_payload)
-
-    @patch("lib.couchdb.project_db_manager.ProjectDBManager")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_run_once_document_not_found(self, mock_init_db, mock_pdm_class):
-        """Test run_once when document is not found."""
+    def test_stop_when_not_running(self):
+        """Test stopping watchers when not running."""
         # Arrange
-        mock_pdm_instance = Mock()
-        mock_pdm_instance.fetch_document_by_id.return_value = None
-        mock_pdm_class.return_value = mock_pdm_instance
-
         core = YggdrasilCore(self.test_config, self.mock_logger)
+        core._running = False
 
         # Act
-        core.run_once("nonexistent_doc")
+        _runner.run(core.stop())
 
         # Assert
-        self.mock_logger.error.assert_called_with("No project with ID nonexistent_doc")
-
-    @patch("lib.core_utils.module_resolver.get_module_location")
-    @patch("lib.couchdb.project_db_manager.ProjectDBManager")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_run_once_no_module_location(
-        self, mock_init_db, mock_pdm_class, mock_get_module
-    ):
-        """Test run_once when module location cannot be determined."""
-        # Arrange
-        mock_pdm_instance = Mock()
-        mock_doc = {"id": "test_doc"}
-        mock_pdm_instance.fetch_document_by_id.return_value = mock_doc
-        mock_pdm_class.return_value = mock_pdm_instance
-
-        mock_get_module.return_value = None
-
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-
-        # Act
-        core.run_once("test_doc_id")
+        self.mock_logger.debug.assert_called_with(
+            "YggdrasilCore stop called, but not running."
+        )
 
-        # Assert
-        self.mock_logger.error.assert_called_with("No module for project test_doc_id")
+    # =====================================================
+    # RUN_ONCE TESTS
+    # =====================================================
 
-    @patch("lib.core_utils.module_resolver.get_module_location")
-    @patch("lib.couchdb.project_db_manager.ProjectDBManager")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_run_once_no_handler(self, mock_init_db, mock_pdm_class, mock_get_module):
-        """Test run_once when no handler is registered."""
+    def test_run_once_success(self):
+        """Test run_once hands the fetched document to the handler's run_now."""
         # Arrange
-        mock_pdm_instance = Mock()
-        mock_doc = {"id": "test_doc"}
-        mock_pdm_instance.fetch_document_by_id.return_value = mock_doc
-        mock_pdm_class.return_value = mock_pdm_instance
-
-        mock_get_module.return_value = "lib.realms.test.test.Test"
+        mock_pdm, mock_get_module = self._patch_run_once_deps()
+        doc = {"id": "test_doc", "data": "test"}
+        module_loc = "lib.realms.test.test.Test"
+        mock_pdm.return_value.fetch_document_by_id.return_value = doc
+        mock_get_module.return_value = module_loc
 
         core = YggdrasilCore(self.test_config, self.mock_logger)
-        # No handler registered
+        mock_handler = Mock()
+        core.handlers[PROJECT_CHANGE] = mock_handler
 
         # Act
         core.run_once("test_doc_id")
 
         # Assert
-        self.mock_logger.error.assert_called_with(
-            "No handler for '%s' event type", EventType.PROJECT_CHANGE
+        mock_pdm.return_value.fetch_document_by_id.assert_called_once_with(
+            "test_doc_id"
         )
+        mock_get_module.assert_called_once_with(doc)
+        mock_handler.run_now.assert_called_once_with(
+            {"document": doc, "module_location": module_loc}
+        )
+        self.mock_logger.error.assert_not_called()
+
+    def test_run_once_early_exit(self):
+        """Test run_once logs an error and stops when a prerequisite is missing."""
+        mock_pdm, mock_get_module = self._patch_run_once_deps()
+        pdm_instance = mock_pdm.return_value
+        doc = {"id": "test_doc", "data": "test"}
+        module_loc = "lib.realms.test.test.Test"
+        cases = [
+            # (label, fetched doc, module location, register a handler,
+            #  expected error log)
+            (
+                "document_not_found",
+                None,
+                module_loc,
+                True,
+                ("No project with ID test_doc_id",),
+            ),
+            (
+                "no_module_location",
+                doc,
+                None,
+                True,
+                ("No module for project test_doc_id",),
+            ),
+            (
+                "no_handler",
+                doc,
+                module_loc,
+                False,
+                ("No handler for '%s' event type", PROJECT_CHANGE),
+            ),
+        ]
 
-    @patch("lib.core_utils.module_resolver.get_module_location")
-    @patch("lib.couchdb.project_db_manager.ProjectDBManager")
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_run_once_handler_no_run_now_method(
-        self, mock_init_db, mock_pdm_class, mock_get_module
-    ):
-        """Test run_once when handler doesn't have run_now method."""
+        for label, fetched, location, register_handler, expected_error in cases:
+            with self.subTest(label):
+                # Arrange
+                SingletonMeta._instances.clear()
+                self.mock_logger.reset_mock()
+                mock_pdm.reset_mock()
+                pdm_instance.fetch_document_by_id.return_value = fetched
+                mock_get_module.reset_mock()
+                mock_get_module.return_value = location
+
+                core = YggdrasilCore(self.test_config, self.mock_logger)
+                mock_handler = Mock()
+                if register_handler:
+                    core.handlers[PROJECT_CHANGE] = mock_handler
+
+                # Act
+                core.run_once("test_doc_id")
+
+                # Assert
+                pdm_instance.fetch_document_by_id.assert_called_once_with("test_doc_id")
+                self.mock_logger.error.assert_called_with(*expected_error)
+                mock_handler.run_now.assert_not_called()
+
+    def test_run_once_handler_no_run_now_method(self):
+        """Test run_once rejects a handler without run_now."""
         # Arrange
-        mock_pdm_instance = Mock()
-        mock_doc = {"id": "test_doc"}
-        mock_pdm_instance.fetch_document_by_id.return_value = mock_doc
-        mock_pdm_class.return_value = mock_pdm_instance
-
+        mock_pdm, mock_get_module = self._patch_run_once_deps()
+        mock_pdm.return_value.fetch_document_by_id.return_value = {"id": "test_doc"}
         mock_get_module.return_value = "lib.realms.test.test.Test"
 
-        mock_handler = Mock()
-        del mock_handler.run_now  # Remove run_now method
-
         core = YggdrasilCore(self.test_config, self.mock_logger)
-        core.handlers[EventType.PROJECT_CHANGE] = mock_handler
+        mock_handler = Mock()
+        del mock_handler.run_now
+        core.handlers[PROJECT_CHANGE] = mock_handler
 
         # Act & Assert
-        with self.assertRaises(RuntimeError) as context:
+        with self.assertRaisesRegex(
+            RuntimeError,
+            re.escape("must implement `.run_now(payload)` for one-off mode"),
+        ):
             core.run_once("test_doc_id")
 
-        self.assertIn(
-            "must implement `.run_now(payload)` for one-off mode",
-            str(context.exception),
-        )
-
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_process_cli_command(self, mock_init_db):
-        """Test CLI command processing."""
-        # Arrange
-        core = YggdrasilCore(self.test_config, self.mock_logger)
-
-        # Act
-        core.process_cli_command("test_command", arg1="value1", arg2="value2")
-
-        # Assert
-        expected_kwargs = {"arg1": "value1", "arg2": "value2"}
-        self.mock_logger.info.assert_called_with(
-            f"Processing CLI command 'test_command' with args={expected_kwargs}"
-        )
-
     # =====================================================
     # EDGE CASES AND ERROR SCENARIOS
     # =====================================================
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_empty_config(self, mock_init_db):
+    def test_empty_config(self):
         """Test initialization with empty configuration."""
         # Act
         core = YggdrasilCore({}, self.mock_logger)
@@ -696,10 +549,10 @@ class TestYggdrasilCore(unittest.TestCase):
         self.assertIsInstance(core.watchers, list)
         self.assertIsInstance(core.handlers, dict)
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_setup_fs_watchers_no_instruments(self, mock_init_db):
+    def test_setup_fs_watchers_no_instruments(self):
         """Test file system watcher setup with no instruments configured."""
         # Arrange
+        self._patch_seq_data_watcher()
         config_no_instruments = {}
         core = YggdrasilCore(config_no_instruments, self.mock_logger)
 
@@ -709,9 +562,9 @@ class TestYggdrasilCore(unittest.TestCase):
         # Assert
         # Should create one watcher from hardcoded config
         self.assertEqual(len(core.watchers), 1)
+        self.assertEqual(core.watchers[0].name, FS_WATCHER_NAME)
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_cdb_watcher_setup_uses_default_poll_interval(self, mock_init_db):
+    def test_cdb_watcher_setup_uses_default_poll_interval(self):
         """Test CouchDB watcher setup uses default poll interval when not in config."""
         # Arrange
         config_no_poll = {}
@@ -730,8 +583,7 @@ class TestYggdrasilCore(unittest.TestCase):
         added_watcher = core.watchers[-1]
         self.assertEqual(added_watcher.poll_interval, 5)  # Default value
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_multiple_watchers_and_handlers(self, mock_init_db):
+    def test_multiple_watchers_and_handlers(self):
         """Test registering multiple watchers and handlers."""
         # Arrange
         core = YggdrasilCore(self.test_config, self.mock_logger)
@@ -744,8 +596,8 @@ class TestYggdrasilCore(unittest.TestCase):
         # Act
         core.register_watcher(mock_watcher1)
         core.register_watcher(mock_watcher2)
-        core.register_handler(EventType.PROJECT_CHANGE, mock_handler1)
-        core.register_handler(EventType.FLOWCELL_READY, mock_handler2)
+        core.register_handler(PROJECT_CHANGE, mock_handler1)
+        core.register_handler(FLOWCELL_READY, mock_handler2)
 
         # Assert
         self.assertEqual(len(core.watchers), 2)
@@ -753,32 +605,216 @@ class TestYggdrasilCore(unittest.TestCase):
         self.assertIn(mock_watcher2, core.watchers)
 
         self.assertEqual(len(core.handlers), 2)
-        self.assertEqual(core.handlers[EventType.PROJECT_CHANGE], mock_handler1)
-        self.assertEqual(core.handlers[EventType.FLOWCELL_READY], mock_handler2)
+        self.assertEqual(core.handlers[PROJECT_CHANGE], mock_handler1)
+        self.assertEqual(core.handlers[FLOWCELL_READY], mock_handler2)
 
-    @patch("lib.core_utils.yggdrasil_core.YggdrasilCore._init_db_managers")
-    def test_start_with_watcher_exception(self, mock_init_db):
+    def test_start_with_watcher_exception(self):
         """Test starting watchers when one raises an exception."""
         # Arrange
         core = YggdrasilCore(self.test_config, self.mock_logger)
 
-        mock_watcher1 = Mock()
-        mock_watcher1.start = AsyncMock()
-        mock_watcher2 = Mock()
-        mock_watcher2.start = AsyncMock(side_effect=Exception("Watcher failed"))
+        mock_watcher1 = _make_async_watcher()
+        mock_watcher2 = _make_async_watcher(fail=True)
 
         core.watchers = [mock_watcher1, mock_watcher2]
 
-        async def test_start():
-            # Act
-            await core.start()
+        # Act
+        _runner.run(core.start())
+
+        # Assert - should still complete despite exception
+        self.assertTrue(core._running)
+        mock_watcher1.start.assert_called_once()
+        mock_watcher2.start.assert_called_once()
+
+
+class TestYggdrasilCoreSharedInstance(unittest.TestCase):
+    """
+    Registration and dispatch tests that only touch watchers/handlers, so they
+    share one YggdrasilCore instead of rebuilding the singleton per test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        SingletonMeta._instances.clear()
+        with patch.object(YggdrasilCore, "_init_db_managers"):
+            cls.core = YggdrasilCore(TEST_CONFIG, _RecLogger())
+        cls.mock_logger = cls.core._logger
+
+    def setUp(self):
+        self.test_event = TEST_EVENT
+        self._reset_core()
+
+    def _reset_core(self):
+        """Reset the state these tests mutate on the shared core."""
+        self.core.watchers = []
+        self.core.handlers = {}
+        self.mock_logger.reset_mock()
+
+    # =====================================================
+    # REGISTRATION TESTS
+    # =====================================================
 
-            # Assert - should still complete despite exception
-            self.assertTrue(core._running)
-            mock_watcher1.start.assert_called_once()
-            mock_watcher2.start.assert_called_once()
+    def test_register_watcher(self):
+        """Test watcher registration functionality."""
+        # Arrange
+        core = self.core
+        mock_watcher = Mock()
+
+        # Act
+        core.register_watcher(mock_watcher)
+
+        # Assert
+        self.assertIn(mock_watcher, core.watchers)
+        self.mock_logger.debug.assert_called_with(
+            f"Registering watcher: {mock_watcher}"
+        )
+
+    def test_register_handler(self):
+        """Test handler registration functionality."""
+        # Arrange
+        core = self.core
+        mock_handler = Mock()
+
+        # Act
+        core.register_handler(PROJECT_CHANGE, mock_handler)
+
+        # Assert
+        self.assertEqual(core.handlers[PROJECT_CHANGE], mock_handler)
+        self.mock_logger.debug.assert_called_with(
+            f"Registered handler for event_type='{PROJECT_CHANGE}'"
+        )
+
+    # =====================================================
+    # EVENT HANDLING AND CLI TESTS
+    # =====================================================
+
+    def test_handle_event(self):
+        """Test event dispatch with a registered, missing and failing handler."""
+        for scenario in ("registered", "missing", "raises"):
+            with self.subTest(handler=scenario):
+                # Arrange
+                self._reset_core()
+                core = self.core
+                mock_handler = None
+                if scenario != "missing":
+                    mock_handler = Mock()
+                    if scenario == "raises":
+                        mock_handler.side_effect = Exception("Handler failed")
+                    core.handlers[PROJECT_CHANGE] = mock_handler
+
+                # Act
+                core.handle_event(self.test_event)
+
+                # Assert
+                self.mock_logger.info.assert_called_with(RECEIVED_MSG)
+                if mock_handler is None:
+                    self.mock_logger.warning.assert_called_with(NO_HANDLER_MSG)
+                    continue
+
+                mock_handler.assert_called_once_with(self.test_event.payload)
+                self.mock_logger.debug.assert_called_with(DISPATCH_MSG)
+                if scenario == "raises":
+                    self.mock_logger.error.assert_called_with(
+                        HANDLER_ERROR_MSG, exc_info=True
+                    )
+                else:
+                    self.mock_logger.error.assert_not_called()
+
+    def test_process_cli_command(self):
+        """Test CLI command processing."""
+        # Arrange
+        core = self.core
+
+        # Act
+        core.process_cli_command("test_command", arg1="value1", arg2="value2")
+
+        # Assert
+        expected_kwargs = {"arg1": "value1", "arg2": "value2"}
+        self.mock_logger.info.assert_called_with(
+            f"Processing CLI command 'test_command' with args={expected_kwargs}"
+        )
+
+
+@unittest.skipUnless(
+    _HAVE_CLOUDANT, "DB manager tests need the IBM Cloudant SDK or its stubs"
+)
+@patch("lib.couchdb.yggdrasil_db_manager.YggdrasilDBManager")
+@patch("lib.couchdb.project_db_manager.ProjectDBManager")
+class TestYggdrasilCoreDBManagers(unittest.TestCase):
+    """
+    Tests for YggdrasilCore._init_db_managers, which runs unpatched here.
+
+    Both DB manager classes are patched for every test in the class.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_logger = _RecLogger()
+
+    def setUp(self):
+        SingletonMeta._instances.clear()
+        self.test_config = TEST_CONFIG
+        self.mock_logger.reset_mock()
+
+    def test_init_db_managers_success(self, mock_pdm_class, mock_ydm_class):
+        """Test successful database manager initialization."""
+        # Arrange
+        mock_pdm_instance = Mock()
+        mock_ydm_instance = Mock()
+        mock_pdm_class.return_value = mock_pdm_instance
+        mock_ydm_class.return_value = mock_ydm_instance
+
+        # Act
+        core = YggdrasilCore(self.test_config, self.mock_logger)
+
+        # Assert
+        self.assertEqual(core.pdm, mock_pdm_instance)
+        self.assertEqual(core.ydm, mock_ydm_instance)
+        mock_pdm_class.assert_called_once()
+        mock_ydm_class.assert_called_once()
+
+        expected_calls = [
+            call("Initializing DB managers..."),
+            call("DB managers initialized."),
+            call("YggdrasilCore initialized."),
+        ]
+        self.mock_logger.info.assert_has_calls(expected_calls)
+
+    def test_init_db_managers_exception(self, mock_pdm_class, mock_ydm_class):
+        """Test database manager initialization with exception."""
+        # Arrange
+        mock_pdm_class.side_effect = Exception("DB connection failed")
+
+        # Act & Assert
+        with self.assertRaisesRegex(Exception, "DB connection failed"):
+            YggdrasilCore(self.test_config, self.mock_logger)
+
+        mock_ydm_class.assert_not_called()
+
+
+class TestYggdrasilCoreWithSdkStubs(unittest.TestCase):
+    """
+    Runs the DB manager tests in a fresh process after another test module
+    has installed the shared SDK stubs, as a full test run does.
+    """
+
+    def test_db_manager_tests_run_after_sdk_stubs(self):
+        """Test the DB manager tests import and run once the stubs are loaded."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "unittest",
+                "tests.test_yggdrasil_db_manager",
+                "tests.test_yggdrasil_core.TestYggdrasilCoreDBManagers",
+            ],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True,
+            text=True,
+        )
 
-        asyncio.run(test_start())
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("skipped", result.stderr)
 
 
 if __name__ == "__main__":
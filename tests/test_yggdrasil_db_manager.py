@@ -1,291 +1,451 @@
-import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, call, create_autospec, patch
 
+# Install the shared IBM Cloud SDK stubs before importing the module under test
+from tests.sdk_stubs import MockApiException  # isort: skip
 
-# Mock IBM Cloud SDK modules before importing the module under test
-class MockApiException(Exception):
-    def __init__(self, message, code=None):
-        super().__init__(message)
-        self.code = code
-        self.message = message
+from lib.core_utils.singleton_decorator import SingletonMeta
+from lib.couchdb import yggdrasil_db_manager as ydm
+from lib.couchdb.couchdb_connection import CouchDBConnectionManager
+from lib.couchdb.yggdrasil_db_manager import YggdrasilDBManager, auto_load_and_save
+from lib.couchdb.yggdrasil_document import YggdrasilDocument
+
+ydm.ApiException = MockApiException
+_db_logger = ydm.logging
+_LOG_LEVELS = ["info", "warning", "error"]
+
+
+# Fixture data shared (read-only) by every test in this module
+MOCK_PROJECT_DATA = {
+    "project_id": "P12345",
+    "projects_reference": "ref_12345",
+    "project_name": "Test Project",
+    "method": "10X",
+    "project_status": "ongoing",
+    "start_date": "2024-01-01T00:00:00",
+    "end_date": "",
+    "samples": [
+        {"sample_id": "S001", "status": "pending", "slurm_job_id": ""},
+        {"sample_id": "S002", "status": "completed", "slurm_job_id": "123456"},
+    ],
+    "user_info": {
+        "owner": {"name": "John Doe", "email": "john@example.com"},
+        "pi": {"name": "Jane Smith", "email": "jane@example.com"},
+    },
+    "delivery_info": {"sensitive": True},
+    "ngi_reports": [
+        {"report_id": "R001", "status": "delivered", "timestamp": "2024-01-01"}
+    ],
+}
+
+# Mock user info for testing
+MOCK_USER_INFO: dict[str, dict[str, str | None]] = {
+    "owner": {"name": "John Doe", "email": "john@example.com"},
+    "pi": {"name": "Jane Smith", "email": "jane@example.com"},
+}
+
+# Mock NGI report data
+MOCK_NGI_REPORT = {
+    "report_id": "R002",
+    "status": "delivered",
+    "timestamp": "2024-01-02",
+}
+
+# Shared errors; side_effect only raises them, so one instance each suffices
+_API_404 = MockApiException("Not Found", code=404)
+_API_500 = MockApiException("Internal Server Error", code=500)
+_API_409 = MockApiException("Document update conflict.", code=409)
+_DB_ERR = Exception("Database error")
+_SAMPLE_ERR = Exception("Sample error")
+_PUT_ERR = Exception("Put failed")
+_METHOD_ERR = Exception("Method error")
+
+# Autospecced document stand-in, built once and reset before every test
+_MOCK_DOC = create_autospec(YggdrasilDocument, instance=True)
+
+_handler_init_patcher = patch.object(ydm.CouchDBHandler, "__init__", return_value=None)
+_mock_handler_init: Mock
+
+
+def setUpModule():
+    # No test here needs a real CouchDB connection, so the handler init stays
+    # patched for the whole module
+    global _mock_handler_init
+    _mock_handler_init = _handler_init_patcher.start()
+
+
+def tearDownModule():
+    _handler_init_patcher.stop()
+
+
+def _make_server(get_result=None, get_exc=None, put_result=None, put_exc=None):
+    """Build a Cloudant server stand-in with pre-wired get/put_document calls."""
+    server = Mock(spec=["get_document", "put_document"])
+    server.get_document.return_value = Mock(get_result=Mock(return_value=get_result))
+    server.get_document.side_effect = get_exc
+    server.put_document.return_value = Mock(get_result=Mock(return_value=put_result))
+    server.put_document.side_effect = put_exc
+    return server
+
+
+def _make_manager(doc=None):
+    """Build a manager whose document load/save hooks are plain Mocks.
+
+    ``get_document_by_project_id`` returns *doc*; tests adjust the stubs
+    further through their ``return_value``/``side_effect`` as needed.
+    """
+    manager = YggdrasilDBManager()
+    manager.get_document_by_project_id = Mock(return_value=doc)
+    manager.save_document = Mock(return_value=None)
+    return manager
 
 
-# Mock the IBM Cloud SDK modules to avoid import errors
-mock_api_exception_module = MagicMock()
-mock_api_exception_module.ApiException = MockApiException
-sys.modules["ibm_cloud_sdk_core"] = MagicMock()
-sys.modules["ibm_cloud_sdk_core.api_exception"] = mock_api_exception_module
-sys.modules["ibmcloudant"] = MagicMock()
-sys.modules["ibmcloudant.cloudant_v1"] = MagicMock()
+def _clear_connection_singleton():
+    """Drop any cached CouchDBConnectionManager so each test builds its own."""
+    SingletonMeta._instances.pop(CouchDBConnectionManager, None)
 
-# Make the ApiException available in the module
-import lib.couchdb.yggdrasil_db_manager
-from lib.core_utils.singleton_decorator import SingletonMeta
-from lib.couchdb.yggdrasil_db_manager import YggdrasilDBManager, auto_load_and_save
 
-lib.couchdb.yggdrasil_db_manager.ApiException = MockApiException
+class _PatchedManagerTestCase(unittest.TestCase):
+    """Base class that patches the document class and logger."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the patchers shared by every test once for the whole class."""
+        patcher = patch.object(ydm, "YggdrasilDocument")
+        cls.mock_ygg_doc_class = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+        # Only the logger methods the manager calls are replaced, not the logger
+        cls.mock_logging = Mock(spec=_LOG_LEVELS)
+        for level in _LOG_LEVELS:
+            patcher = patch.object(_db_logger, level, getattr(cls.mock_logging, level))
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        """Set up test fixtures and clear singleton instances for test isolation."""
+        self.mock_handler_init = _mock_handler_init
+        self.mock_handler_init.reset_mock()
+        self.mock_ygg_doc_class.reset_mock(return_value=True, side_effect=True)
+        self.mock_logging.reset_mock()
+        _MOCK_DOC.reset_mock(return_value=True, side_effect=True)
+        self.mock_doc = _MOCK_DOC
+
+        # Clear singleton instances to ensure test isolation
+        _clear_connection_singleton()
+        self.addCleanup(_clear_connection_singleton)
 
 
-class TestYggdrasilDBManager(unittest.TestCase):
+class TestYggdrasilDBManager(_PatchedManagerTestCase):
     """
     Comprehensive tests for YggdrasilDBManager class.
     Tests initialization, document CRUD operations, decorated methods, and error handling.
     """
 
-    def setUp(self):
-        """Set up test fixtures and clear singleton instances for test isolation."""
-        # Clear singleton instances to ensure test isolation
-        from lib.couchdb.couchdb_connection import CouchDBConnectionManager
-
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
-
-        # Mock project data
-        self.mock_project_data = {
-            "project_id": "P12345",
-            "projects_reference": "ref_12345",
-            "project_name": "Test Project",
-            "method": "10X",
-            "project_status": "ongoing",
-            "start_date": "2024-01-01T00:00:00",
-            "end_date": "",
-            "samples": [
-                {"sample_id": "S001", "status": "pending", "slurm_job_id": ""},
-                {"sample_id": "S002", "status": "completed", "slurm_job_id": "123456"},
-            ],
-            "user_info": {
-                "owner": {"name": "John Doe", "email": "john@example.com"},
-                "pi": {"name": "Jane Smith", "email": "jane@example.com"},
-            },
-            "delivery_info": {"sensitive": True},
-            "ngi_reports": [
-                {"report_id": "R001", "status": "delivered", "timestamp": "2024-01-01"}
-            ],
-        }
-
-        # Mock user info for testing
-        self.mock_user_info: dict[str, dict[str, str | None]] = {
-            "owner": {"name": "John Doe", "email": "john@example.com"},
-            "pi": {"name": "Jane Smith", "email": "jane@example.com"},
-        }
-
-        # Mock NGI report data
-        self.mock_ngi_report = {
-            "report_id": "R002",
-            "status": "delivered",
-            "timestamp": "2024-01-02",
-        }
-
-    def tearDown(self):
-        """Clean up singleton instances after each test."""
-        from lib.couchdb.couchdb_connection import CouchDBConnectionManager
-
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    def test_init_success(self, mock_handler_init):
+    def test_init_success(self):
         """Test successful initialization of YggdrasilDBManager."""
         # Arrange
-        mock_handler_init.return_value = None
 
         # Act
         YggdrasilDBManager()
 
         # Assert
-        mock_handler_init.assert_called_once_with("yggdrasil")
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.YggdrasilDocument")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_create_project_success(
-        self, mock_logging, mock_ygg_doc_class, mock_handler_init
-    ):
-        """Test successful project creation."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_ygg_doc = MagicMock()
-        mock_ygg_doc_class.return_value = mock_ygg_doc
+        self.mock_handler_init.assert_called_once_with("yggdrasil")
+
+    def test_create_project(self):
+        """Test project creation with and without user info and sensitive flag."""
+        cases = [
+            ("with user info", {"user_info": MOCK_USER_INFO, "sensitive": True}, True),
+            ("without user info, default sensitive", {}, True),
+            ("sensitive false", {"sensitive": False}, False),
+        ]
+        for label, kwargs, expected_sensitive in cases:
+            with self.subTest(label):
+                # Arrange
+                self.mock_ygg_doc_class.reset_mock()
+                self.mock_logging.reset_mock()
+                mock_ygg_doc = SimpleNamespace(delivery_info={})
+                self.mock_ygg_doc_class.return_value = mock_ygg_doc
+
+                manager = _make_manager()
+
+                # Act
+                result = manager.create_project(
+                    project_id="P12345",
+                    projects_reference="ref_12345",
+                    project_name="Test Project",
+                    method="10X",
+                    **kwargs,
+                )
+
+                # Assert
+                self.assertEqual(
+                    self.mock_ygg_doc_class.call_args_list,
+                    [
+                        call(
+                            project_id="P12345",
+                            projects_reference="ref_12345",
+                            project_name="Test Project",
+                            method="10X",
+                        )
+                    ],
+                )
+                if "user_info" in kwargs:
+                    self.assertIs(mock_ygg_doc.user_info, MOCK_USER_INFO)
+                self.assertIs(
+                    mock_ygg_doc.delivery_info["sensitive"], expected_sensitive
+                )
+                self.assertEqual(
+                    manager.save_document.call_args_list, [call(mock_ygg_doc)]
+                )
+                self.mock_logging.info.assert_called_with(
+                    "New project with ID 'P12345' created successfully."
+                )
+                self.assertIs(result, mock_ygg_doc)
+
+    def _ensure_project(self, stored_doc, put_exc=None):
+        """Run ensure_project against a server whose PUT returns or raises."""
+        mock_server = _make_server(
+            put_result={"ok": True, "id": "P12345", "rev": "1-a"}, put_exc=put_exc
+        )
+        manager = _make_manager(stored_doc)
+        manager.server = mock_server
+        manager.db_name = "yggdrasil"
 
-        manager = YggdrasilDBManager()
-        manager.save_document = MagicMock()
+        document, created = manager.ensure_project(
+            "P12345", "ref_12345", "Test Project", "10X"
+        )
 
-        # Act
-        result = manager.create_project(
-            project_id="P12345",
-            projects_reference="ref_12345",
-            project_name="Test Project",
-            method="10X",
-            user_info=self.mock_user_info,
-            sensitive=True,
+        # One unconditional PUT without a _rev, no GET first
+        mock_server.get_document.assert_not_called()
+        self.assertEqual(
+            mock_server.put_document.call_args_list,
+            [call(db="yggdrasil", doc_id="P12345", document={"_id": "P12345"})],
         )
+        return manager, document, created
 
-        # Assert
-        mock_ygg_doc_class.assert_called_once_with(
-            project_id="P12345",
-            projects_reference="ref_12345",
-            project_name="Test Project",
-            method="10X",
+    def _new_project_doc(self):
+        """Make YggdrasilDocument build a stand-in for the new project doc."""
+        new_doc = SimpleNamespace(
+            _id="P12345", delivery_info={}, to_dict=lambda: {"_id": "P12345"}
         )
-        # Check that user info and sensitive flag were set
-        self.assertEqual(mock_ygg_doc.user_info, self.mock_user_info)
-        mock_ygg_doc.delivery_info.__setitem__.assert_called_with("sensitive", True)
-        manager.save_document.assert_called_once_with(mock_ygg_doc)
-        mock_logging.info.assert_called_with(
-            "New project with ID 'P12345' created successfully."
+        self.mock_ygg_doc_class.return_value = new_doc
+        return new_doc
+
+    def test_ensure_project_created(self):
+        """Test ensure_project returns the new document when the PUT succeeds."""
+        new_doc = self._new_project_doc()
+
+        manager, document, created = self._ensure_project(self.mock_doc)
+
+        self.assertIs(document, new_doc)
+        self.assertTrue(created)
+        manager.get_document_by_project_id.assert_not_called()
+        self.mock_logging.error.assert_not_called()
+
+    def test_ensure_project_conflict_returns_existing(self):
+        """Test a 409 conflict loads the stored document without logging."""
+        self._new_project_doc()
+
+        manager, document, created = self._ensure_project(
+            self.mock_doc, put_exc=_API_409
         )
-        self.assertEqual(result, mock_ygg_doc)
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.YggdrasilDocument")
-    def test_create_project_without_user_info(
-        self, mock_ygg_doc_class, mock_handler_init
-    ):
-        """Test project creation without user info."""
+
+        self.assertIs(document, self.mock_doc)
+        self.assertFalse(created)
+        manager.get_document_by_project_id.assert_called_once_with("P12345")
+        # The caller reports the existing project; no record here
+        self.mock_logging.info.assert_not_called()
+        self.mock_logging.error.assert_not_called()
+
+    def test_ensure_project_error(self):
+        """Test ensure_project reports failure when the PUT fails otherwise."""
+        self._new_project_doc()
+        for label, put_exc in [("api error", _API_500), ("other error", _PUT_ERR)]:
+            with self.subTest(label):
+                self.mock_logging.reset_mock()
+
+                manager, document, created = self._ensure_project(
+                    self.mock_doc, put_exc=put_exc
+                )
+
+                self.assertIsNone(document)
+                self.assertFalse(created)
+                manager.get_document_by_project_id.assert_not_called()
+                self.mock_logging.error.assert_called_once()
+
+    def test_save_document(self):
+        """Test saving a new document and an existing one (preserving _rev)."""
+        cases = [
+            # (label, get_document behaviour, expected saved document)
+            (
+                "new document",
+                {"get_exc": _API_404},
+                {"_id": "P12345", "data": "test"},
+            ),
+            (
+                "existing document",
+                {"get_result": {"_id": "P12345", "_rev": "1-abc123", "old": "data"}},
+                {"_id": "P12345", "data": "test", "_rev": "1-abc123"},
+            ),
+        ]
+        for label, get_kwargs, expected_save_data in cases:
+            with self.subTest(label):
+                # Arrange
+                self.mock_logging.reset_mock()
+                mock_server = _make_server(put_result={"ok": True}, **get_kwargs)
+
+                manager = YggdrasilDBManager()
+                manager.server = mock_server
+                manager.db_name = "yggdrasil"
+
+                mock_doc = SimpleNamespace(
+                    _id="P12345", to_dict=lambda: {"_id": "P12345", "data": "test"}
+                )
+
+                # Act
+                manager.save_document(mock_doc)
+
+                # Assert
+                self.assertEqual(
+                    mock_server.get_document.call_args_list,
+                    [call(db="yggdrasil", doc_id="P12345")],
+                )
+                self.assertEqual(
+                    mock_server.put_document.call_args_list,
+                    [
+                        call(
+                            db="yggdrasil",
+                            doc_id="P12345",
+                            document=expected_save_data,
+                        )
+                    ],
+                )
+                self.mock_logging.info.assert_called_with(
+                    "Document with ID 'P12345' saved successfully in 'yggdrasil' DB."
+                )
+
+    def test_save_document_exception(self):
+        """Test save_document when an exception occurs."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_ygg_doc = MagicMock()
-        mock_ygg_doc_class.return_value = mock_ygg_doc
+        mock_server = _make_server(get_exc=_DB_ERR)
 
         manager = YggdrasilDBManager()
-        manager.save_document = MagicMock()
+        manager.server = mock_server
+        manager.db_name = "yggdrasil"
+
+        mock_doc = SimpleNamespace(_id="P12345")
 
         # Act
-        result = manager.create_project(
-            project_id="P12345",
-            projects_reference="ref_12345",
-            project_name="Test Project",
-            method="10X",
-        )
+        manager.save_document(mock_doc)
 
         # Assert
-        # Verify the document was created correctly
-        mock_ygg_doc_class.assert_called_once_with(
-            project_id="P12345",
-            projects_reference="ref_12345",
-            project_name="Test Project",
-            method="10X",
+        self.mock_logging.error.assert_called_with(
+            "Error saving document: Database error"
         )
-        # sensitive should default to True
-        mock_ygg_doc.delivery_info.__setitem__.assert_called_with("sensitive", True)
-        # Document should be saved
-        manager.save_document.assert_called_once_with(mock_ygg_doc)
-        # Should return the created document
-        self.assertEqual(result, mock_ygg_doc)
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_save_document_new_document(self, mock_logging, mock_handler_init):
-        """Test saving a new document (no existing _rev)."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-
-        # Mock get_document to raise 404 (document doesn't exist)
-        api_exception = MockApiException("Not Found", code=404)
-        mock_server.get_document.side_effect = api_exception
 
-        # Mock successful put_document
-        mock_server.put_document.return_value.get_result.return_value = {"ok": True}
+    def test_save_document_reuses_returned_rev(self):
+        """Test the _rev returned by a save skips the GET on the next save."""
+        # Arrange
+        mock_server = _make_server(
+            get_exc=_API_404, put_result={"ok": True, "id": "P12345", "rev": "1-a"}
+        )
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
         manager.db_name = "yggdrasil"
 
-        mock_doc = MagicMock()
-        mock_doc._id = "P12345"
-        mock_doc.to_dict.return_value = {"_id": "P12345", "data": "test"}
+        mock_doc = SimpleNamespace(
+            _id="P12345", to_dict=lambda: {"_id": "P12345", "data": "test"}
+        )
 
-        # Act
+        # Act - the first save creates the document, the second updates it
+        manager.save_document(mock_doc)
         manager.save_document(mock_doc)
 
         # Assert
         mock_server.get_document.assert_called_once_with(
             db="yggdrasil", doc_id="P12345"
         )
-        mock_server.put_document.assert_called_once_with(
-            db="yggdrasil", doc_id="P12345", document={"_id": "P12345", "data": "test"}
-        )
-        mock_logging.info.assert_called_with(
-            "Document with ID 'P12345' saved successfully in 'yggdrasil' DB."
+        self.assertEqual(
+            [
+                c.kwargs["document"].get("_rev")
+                for c in mock_server.put_document.call_args_list
+            ],
+            [None, "1-a"],
         )
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_save_document_existing_document(self, mock_logging, mock_handler_init):
-        """Test saving an existing document (preserves _rev)."""
+    def test_get_document_by_project_id_remembers_rev(self):
+        """Test saving a just-loaded document reuses the loaded _rev."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-
-        # Mock get_document to return existing document with _rev
-        mock_server.get_document.return_value.get_result.return_value = {
-            "_id": "P12345",
-            "_rev": "1-abc123",
-            "old": "data",
-        }
-
-        # Mock successful put_document
-        mock_server.put_document.return_value.get_result.return_value = {"ok": True}
+        mock_server = _make_server(
+            get_result={**MOCK_PROJECT_DATA, "_rev": "3-c"}, put_result={"ok": True}
+        )
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
         manager.db_name = "yggdrasil"
 
-        mock_doc = MagicMock()
-        mock_doc._id = "P12345"
-        mock_doc.to_dict.return_value = {"_id": "P12345", "data": "test"}
+        mock_doc = SimpleNamespace(
+            _id="P12345", to_dict=lambda: {"_id": "P12345", "data": "test"}
+        )
 
         # Act
+        manager.get_document_by_project_id("P12345")
         manager.save_document(mock_doc)
 
-        # Assert
+        # Assert - only the load hit get_document
         mock_server.get_document.assert_called_once_with(
             db="yggdrasil", doc_id="P12345"
         )
-        expected_save_data = {"_id": "P12345", "data": "test", "_rev": "1-abc123"}
         mock_server.put_document.assert_called_once_with(
-            db="yggdrasil", doc_id="P12345", document=expected_save_data
+            db="yggdrasil",
+            doc_id="P12345",
+            document={"_id": "P12345", "data": "test", "_rev": "3-c"},
         )
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_save_document_exception(self, mock_logging, mock_handler_init):
-        """Test save_document when an exception occurs."""
+    def test_save_document_stale_rev_refetches(self):
+        """Test a conflicting cached _rev falls back to fetching the current one."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-        mock_server.get_document.side_effect = Exception("Database error")
+        mock_server = _make_server(get_result={"_id": "P12345", "_rev": "5-new"})
+        mock_server.put_document.side_effect = [
+            _API_409,
+            Mock(get_result=Mock(return_value={"ok": True})),
+        ]
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
         manager.db_name = "yggdrasil"
 
-        mock_doc = MagicMock()
-        mock_doc._id = "P12345"
+        mock_doc = SimpleNamespace(
+            _id="P12345", to_dict=lambda: {"_id": "P12345", "data": "test"}
+        )
 
         # Act
+        manager._remember_rev("P12345", "4-old")
         manager.save_document(mock_doc)
 
         # Assert
-        mock_logging.error.assert_called_with("Error saving document: Database error")
+        mock_server.get_document.assert_called_once_with(
+            db="yggdrasil", doc_id="P12345"
+        )
+        self.assertEqual(
+            [
+                c.kwargs["document"]["_rev"]
+                for c in mock_server.put_document.call_args_list
+            ],
+            ["4-old", "5-new"],
+        )
+        self.mock_logging.error.assert_not_called()
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.YggdrasilDocument")
-    def test_get_document_by_project_id_success(
-        self, mock_ygg_doc_class, mock_handler_init
-    ):
+    def test_get_document_by_project_id_success(self):
         """Test successful document retrieval by project ID."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-        mock_server.get_document.return_value.get_result.return_value = (
-            self.mock_project_data
-        )
+        mock_server = _make_server(get_result=MOCK_PROJECT_DATA)
 
-        mock_ygg_doc = MagicMock()
-        mock_ygg_doc_class.from_dict.return_value = mock_ygg_doc
+        mock_ygg_doc = Mock(spec=YggdrasilDocument)
+        self.mock_ygg_doc_class.from_dict.return_value = mock_ygg_doc
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
@@ -298,22 +458,14 @@ class TestYggdrasilDBManager(unittest.TestCase):
         mock_server.get_document.assert_called_once_with(
             db="yggdrasil", doc_id="P12345"
         )
-        mock_ygg_doc_class.from_dict.assert_called_once_with(self.mock_project_data)
-        self.assertEqual(result, mock_ygg_doc)
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_get_document_by_project_id_not_found(
-        self, mock_logging, mock_handler_init
-    ):
+        self.mock_ygg_doc_class.from_dict.assert_called_once_with(MOCK_PROJECT_DATA)
+        self.assertIs(result, mock_ygg_doc)
+
+    def test_get_document_by_project_id_not_found(self):
         """Test document retrieval when document doesn't exist."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-
         # Mock ApiException for 404 (document not found)
-        api_exception = MockApiException("Not Found", code=404)
-        mock_server.get_document.side_effect = api_exception
+        mock_server = _make_server(get_exc=_API_404)
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
@@ -324,18 +476,12 @@ class TestYggdrasilDBManager(unittest.TestCase):
 
         # Assert
         self.assertIsNone(result)
-        mock_logging.info.assert_called_with("Project with ID 'nonexistent' not found.")
+        self.mock_ygg_doc_class.from_dict.assert_not_called()
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_get_document_by_project_id_exception(
-        self, mock_logging, mock_handler_init
-    ):
+    def test_get_document_by_project_id_exception(self):
         """Test document retrieval when an exception occurs."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-        mock_server.get_document.side_effect = Exception("Database error")
+        mock_server = _make_server(get_exc=_DB_ERR)
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
@@ -346,23 +492,13 @@ class TestYggdrasilDBManager(unittest.TestCase):
 
         # Assert
         self.assertIsNone(result)
-        mock_logging.error.assert_called_with(
-            "Error accessing project 'P12345': Database error"
-        )
+        self.mock_ygg_doc_class.from_dict.assert_not_called()
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_get_document_by_project_id_api_exception_other_codes(
-        self, mock_logging, mock_handler_init
-    ):
+    def test_get_document_by_project_id_api_exception_other_codes(self):
         """Test document retrieval when API exception with non-404 code occurs."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-
         # Mock ApiException for 500 (server error)
-        api_exception = MockApiException("Internal Server Error", code=500)
-        mock_server.get_document.side_effect = api_exception
+        mock_server = _make_server(get_exc=_API_500)
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
@@ -373,20 +509,13 @@ class TestYggdrasilDBManager(unittest.TestCase):
 
         # Assert
         self.assertIsNone(result)
-        mock_logging.error.assert_called_with(
-            "Error accessing project 'P12345': 500 Internal Server Error"
-        )
+        self.mock_ygg_doc_class.from_dict.assert_not_called()
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_check_project_exists_true(self, mock_logging, mock_handler_init):
+    def test_check_project_exists_true(self):
         """Test check_project_exists when project exists."""
         # Arrange
-        mock_handler_init.return_value = None
-        manager = YggdrasilDBManager()
-
-        mock_doc = MagicMock()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
+        mock_doc = self.mock_doc
+        manager = _make_manager(mock_doc)
 
         # Act
         result = manager.check_project_exists("P12345")
@@ -394,17 +523,12 @@ class TestYggdrasilDBManager(unittest.TestCase):
         # Assert
         self.assertTrue(result)
         manager.get_document_by_project_id.assert_called_once_with("P12345")
-        mock_logging.info.assert_called_with("Project with ID 'P12345' exists.")
+        self.mock_logging.info.assert_called_with("Project with ID 'P12345' exists.")
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_check_project_exists_false(self, mock_logging, mock_handler_init):
+    def test_check_project_exists_false(self):
         """Test check_project_exists when project doesn't exist."""
         # Arrange
-        mock_handler_init.return_value = None
-        manager = YggdrasilDBManager()
-
-        manager.get_document_by_project_id = MagicMock(return_value=None)
+        manager = _make_manager()
 
         # Act
         result = manager.check_project_exists("nonexistent")
@@ -412,43 +536,115 @@ class TestYggdrasilDBManager(unittest.TestCase):
         # Assert
         self.assertFalse(result)
         manager.get_document_by_project_id.assert_called_once_with("nonexistent")
-        mock_logging.info.assert_called_with(
+        self.mock_logging.info.assert_called_with(
             "Project with ID 'nonexistent' does not exist."
         )
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_add_sample_success(self, mock_logging, mock_handler_init):
-        """Test successful sample addition using the decorated method."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
-
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
-
-        # Act
-        manager.add_sample("P12345", "S003", "pending")
-
-        # Assert
-        manager.get_document_by_project_id.assert_called_once_with("P12345")
-        mock_doc.add_sample.assert_called_once_with(sample_id="S003", status="pending")
-        manager.save_document.assert_called_once_with(mock_doc)
-        mock_logging.info.assert_called_with(
-            "Sample 'S003' added with status 'pending'."
-        )
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_add_sample_project_not_found(self, mock_logging, mock_handler_init):
+    def test_decorated_methods(self):
+        """Test each decorated method updates, saves and logs via the loaded doc."""
+        cases = [
+            # (method, args, doc method, doc return, expected doc call,
+            #  expected result, log level, expected log message)
+            (
+                "add_sample",
+                ("P12345", "S003", "pending"),
+                "add_sample",
+                None,
+                call(sample_id="S003", status="pending"),
+                None,
+                "info",
+                "Sample 'S003' added with status 'pending'.",
+            ),
+            (
+                "update_sample_status",
+                ("P12345", "S001", "completed"),
+                "update_sample_status",
+                None,
+                call(sample_id="S001", status="completed"),
+                None,
+                "info",
+                "Sample 'S001' status updated to 'completed'.",
+            ),
+            (
+                "add_ngi_report_entry",
+                ("P12345", MOCK_NGI_REPORT),
+                "add_ngi_report_entry",
+                True,
+                call(MOCK_NGI_REPORT),
+                True,
+                "info",
+                "NGI report entry added to the document.",
+            ),
+            (
+                "add_ngi_report_entry",
+                ("P12345", MOCK_NGI_REPORT),
+                "add_ngi_report_entry",
+                False,
+                call(MOCK_NGI_REPORT),
+                False,
+                "warning",
+                "NGI report entry failed to be added to the document.",
+            ),
+            (
+                "update_sample_slurm_job_id",
+                ("P12345", "S001", "789012"),
+                "update_sample_field",
+                True,
+                call("S001", "slurm_job_id", "789012"),
+                None,
+                "info",
+                "Sample 'S001' slurm_job_id set to '789012'.",
+            ),
+            (
+                "update_sample_slurm_job_id",
+                ("P12345", "S001", "789012"),
+                "update_sample_field",
+                False,
+                call("S001", "slurm_job_id", "789012"),
+                None,
+                "warning",
+                "Failed to update slurm_job_id for sample 'S001'.",
+            ),
+        ]
+        for (
+            method,
+            args,
+            doc_method,
+            doc_return,
+            expected_call,
+            expected_result,
+            level,
+            message,
+        ) in cases:
+            with self.subTest(method=method, doc_return=doc_return):
+                # Arrange
+                self.mock_logging.reset_mock()
+                mock_doc = self.mock_doc
+                mock_doc.reset_mock(return_value=True, side_effect=True)
+                getattr(mock_doc, doc_method).return_value = doc_return
+
+                manager = _make_manager(mock_doc)
+
+                # Act
+                result = getattr(manager, method)(*args)
+
+                # Assert - the doc is saved even if its method reports failure
+                self.assertEqual(result, expected_result)
+                self.assertEqual(
+                    manager.get_document_by_project_id.call_args_list,
+                    [call("P12345")],
+                )
+                self.assertEqual(
+                    getattr(mock_doc, doc_method).call_args_list, [expected_call]
+                )
+                self.assertEqual(manager.save_document.call_args_list, [call(mock_doc)])
+                getattr(self.mock_logging, level).assert_called_with(message)
+
+    def test_add_sample_project_not_found(self):
         """Test add_sample when project doesn't exist."""
         # Arrange
-        mock_handler_init.return_value = None
 
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=None)
-        manager.save_document = MagicMock()
+        manager = _make_manager()
 
         # Act
         result = manager.add_sample("nonexistent", "S003", "pending")
@@ -457,22 +653,17 @@ class TestYggdrasilDBManager(unittest.TestCase):
         self.assertIsNone(result)
         manager.get_document_by_project_id.assert_called_once_with("nonexistent")
         manager.save_document.assert_not_called()
-        mock_logging.error.assert_called_with(
+        self.mock_logging.error.assert_called_with(
             "Project 'nonexistent' not found in Yggdrasil DB."
         )
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_add_sample_exception_in_method(self, mock_logging, mock_handler_init):
+    def test_add_sample_exception_in_method(self):
         """Test add_sample when an exception occurs in the decorated method."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
-        mock_doc.add_sample.side_effect = Exception("Sample error")
+        mock_doc = self.mock_doc
+        mock_doc.add_sample.side_effect = _SAMPLE_ERR
 
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
+        manager = _make_manager(mock_doc)
 
         # Act
         result = manager.add_sample("P12345", "S003", "pending")
@@ -480,292 +671,96 @@ class TestYggdrasilDBManager(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
         manager.save_document.assert_not_called()
-        mock_logging.error.assert_called_with(
+        self.mock_logging.error.assert_called_with(
             "Error in add_sample for project P12345: Sample error"
         )
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_update_sample_status_success(self, mock_logging, mock_handler_init):
-        """Test successful sample status update."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
-
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
-
-        # Act
-        manager.update_sample_status("P12345", "S001", "completed")
-
-        # Assert
-        manager.get_document_by_project_id.assert_called_once_with("P12345")
-        mock_doc.update_sample_status.assert_called_once_with(
-            sample_id="S001", status="completed"
-        )
-        manager.save_document.assert_called_once_with(mock_doc)
-        mock_logging.info.assert_called_with(
-            "Sample 'S001' status updated to 'completed'."
-        )
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_add_ngi_report_entry_success(self, mock_logging, mock_handler_init):
-        """Test successful NGI report entry addition."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
-        mock_doc.add_ngi_report_entry.return_value = True
-
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
-
-        # Act
-        result = manager.add_ngi_report_entry("P12345", self.mock_ngi_report)
-
-        # Assert
-        self.assertTrue(result)
-        manager.get_document_by_project_id.assert_called_once_with("P12345")
-        mock_doc.add_ngi_report_entry.assert_called_once_with(self.mock_ngi_report)
-        manager.save_document.assert_called_once_with(mock_doc)
-        mock_logging.info.assert_called_with("NGI report entry added to the document.")
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_add_ngi_report_entry_failure(self, mock_logging, mock_handler_init):
-        """Test NGI report entry addition when document method returns False."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
-        mock_doc.add_ngi_report_entry.return_value = False
-
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
-
-        # Act
-        result = manager.add_ngi_report_entry("P12345", self.mock_ngi_report)
-
-        # Assert
-        self.assertFalse(result)
-        mock_doc.add_ngi_report_entry.assert_called_once_with(self.mock_ngi_report)
-        manager.save_document.assert_called_once_with(
-            mock_doc
-        )  # Still saves even if method returns False
-        mock_logging.warning.assert_called_with(
-            "NGI report entry failed to be added to the document."
-        )
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_update_sample_slurm_job_id_success(self, mock_logging, mock_handler_init):
-        """Test successful SLURM job ID update."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
-        mock_doc.update_sample_field.return_value = True
-
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
 
-        # Act
-        manager.update_sample_slurm_job_id("P12345", "S001", "789012")
-
-        # Assert
-        manager.get_document_by_project_id.assert_called_once_with("P12345")
-        mock_doc.update_sample_field.assert_called_once_with(
-            "S001", "slurm_job_id", "789012"
-        )
-        manager.save_document.assert_called_once_with(mock_doc)
-        mock_logging.info.assert_called_with(
-            "Sample 'S001' slurm_job_id set to '789012'."
-        )
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_update_sample_slurm_job_id_failure(self, mock_logging, mock_handler_init):
-        """Test SLURM job ID update when document method returns False."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
-        mock_doc.update_sample_field.return_value = False
-
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
-
-        # Act
-        manager.update_sample_slurm_job_id("P12345", "S001", "789012")
-
-        # Assert
-        mock_doc.update_sample_field.assert_called_once_with(
-            "S001", "slurm_job_id", "789012"
-        )
-        manager.save_document.assert_called_once_with(
-            mock_doc
-        )  # Still saves even if method returns False
-        mock_logging.warning.assert_called_with(
-            "Failed to update slurm_job_id for sample 'S001'."
-        )
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.YggdrasilDocument")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_create_project_with_default_sensitive_flag(
-        self, mock_logging, mock_ygg_doc_class, mock_handler_init
-    ):
-        """Test project creation with default sensitive flag."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_ygg_doc = MagicMock()
-        mock_ygg_doc_class.return_value = mock_ygg_doc
-
-        manager = YggdrasilDBManager()
-        manager.save_document = MagicMock()
-
-        # Act - not passing sensitive parameter to test default
-        manager.create_project(
-            project_id="P12345",
-            projects_reference="ref_12345",
-            project_name="Test Project",
-            method="10X",
-        )
-
-        # Assert
-        # sensitive should default to True when not specified
-        mock_ygg_doc.delivery_info.__setitem__.assert_called_with("sensitive", True)
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.YggdrasilDocument")
-    def test_create_project_with_sensitive_false(
-        self, mock_ygg_doc_class, mock_handler_init
-    ):
-        """Test project creation with sensitive flag set to False."""
-        # Arrange
-        mock_handler_init.return_value = None
-        mock_ygg_doc = MagicMock()
-        mock_ygg_doc_class.return_value = mock_ygg_doc
-
-        manager = YggdrasilDBManager()
-        manager.save_document = MagicMock()
+# Decorated functions are built once at import time and shared by the cases below
+@auto_load_and_save
+def _ok_method(manager, doc, arg1, kwarg1=None):
+    return f"result_{arg1}_{kwarg1}"
 
-        # Act
-        manager.create_project(
-            project_id="P12345",
-            projects_reference="ref_12345",
-            project_name="Test Project",
-            method="10X",
-            sensitive=False,
-        )
 
-        # Assert
-        mock_ygg_doc.delivery_info.__setitem__.assert_called_with("sensitive", False)
+@auto_load_and_save
+def _raising_method(manager, doc, arg1):
+    raise _METHOD_ERR
 
 
 class TestAutoLoadAndSaveDecorator(unittest.TestCase):
     """Test the auto_load_and_save decorator functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_manager = MagicMock()
-        self.mock_doc = MagicMock()
-
-    def test_decorator_success(self):
-        """Test decorator with successful method execution."""
-        # Arrange
-        self.mock_manager.get_document_by_project_id.return_value = self.mock_doc
-        self.mock_manager.save_document = MagicMock()
-
-        @auto_load_and_save
-        def test_method(manager, doc, arg1, kwarg1=None):
-            return f"result_{arg1}_{kwarg1}"
-
-        # Act
-        result = test_method(
-            self.mock_manager, "P12345", "test_arg", kwarg1="test_kwarg"
-        )
-
-        # Assert
-        self.assertEqual(result, "result_test_arg_test_kwarg")
-        self.mock_manager.get_document_by_project_id.assert_called_once_with("P12345")
-        self.mock_manager.save_document.assert_called_once_with(self.mock_doc)
-
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_decorator_project_not_found(self, mock_logging):
-        """Test decorator when project is not found."""
-        # Arrange
-        self.mock_manager.get_document_by_project_id.return_value = None
-
-        @auto_load_and_save
-        def test_method(manager, doc, arg1):
-            return f"result_{arg1}"
-
-        # Act
-        result = test_method(self.mock_manager, "nonexistent", "test_arg")
-
-        # Assert
-        self.assertIsNone(result)
-        self.mock_manager.get_document_by_project_id.assert_called_once_with(
-            "nonexistent"
-        )
-        mock_logging.error.assert_called_with(
-            "Project 'nonexistent' not found in Yggdrasil DB."
-        )
-
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_decorator_method_exception(self, mock_logging):
-        """Test decorator when the wrapped method raises an exception."""
-        # Arrange
-        self.mock_manager.get_document_by_project_id.return_value = self.mock_doc
-        self.mock_manager.save_document = MagicMock()
-
-        @auto_load_and_save
-        def test_method(manager, doc, arg1):
-            raise Exception("Method error")
-
-        # Act
-        result = test_method(self.mock_manager, "P12345", "test_arg")
-
-        # Assert
-        self.assertIsNone(result)
-        self.mock_manager.get_document_by_project_id.assert_called_once_with("P12345")
-        self.mock_manager.save_document.assert_not_called()
-        mock_logging.error.assert_called_with(
-            "Error in test_method for project P12345: Method error"
-        )
-
-
-class TestEdgeCasesAndIntegration(unittest.TestCase):
+    def test_decorator(self):
+        """Test decorator on success, missing project and wrapped-method error."""
+        mock_doc = Mock(spec=[])
+        cases = [
+            # (label, fn, project_id, doc, kwargs, expected result, expected error)
+            (
+                "success",
+                _ok_method,
+                "P12345",
+                mock_doc,
+                {"kwarg1": "test_kwarg"},
+                "result_test_arg_test_kwarg",
+                None,
+            ),
+            (
+                "project not found",
+                _ok_method,
+                "nonexistent",
+                None,
+                {},
+                None,
+                "Project 'nonexistent' not found in Yggdrasil DB.",
+            ),
+            (
+                "method exception",
+                _raising_method,
+                "P12345",
+                mock_doc,
+                {},
+                None,
+                "Error in _raising_method for project P12345: Method error",
+            ),
+        ]
+        with patch.object(_db_logger, "error") as mock_error:
+            for label, fn, project_id, doc, kwargs, expected, error in cases:
+                with self.subTest(label):
+                    # Arrange
+                    mock_error.reset_mock()
+                    mock_manager = Mock(
+                        spec=["get_document_by_project_id", "save_document"]
+                    )
+                    mock_manager.get_document_by_project_id.return_value = doc
+
+                    # Act
+                    result = fn(mock_manager, project_id, "test_arg", **kwargs)
+
+                    # Assert
+                    self.assertEqual(result, expected)
+                    self.assertEqual(
+                        mock_manager.get_document_by_project_id.call_args_list,
+                        [call(project_id)],
+                    )
+                    if error is None:
+                        self.assertEqual(
+                            mock_manager.save_document.call_args_list, [call(doc)]
+                        )
+                        mock_error.assert_not_called()
+                    else:
+                        mock_manager.save_document.assert_not_called()
+                        mock_error.assert_called_with(error)
+
+
+class TestEdgeCasesAndIntegration(_PatchedManagerTestCase):
     """Test edge cases and integration scenarios for YggdrasilDBManager."""
 
-    def setUp(self):
-        """Set up test fixtures for edge case testing."""
-        # Clear singleton instances to ensure test isolation
-        from lib.couchdb.couchdb_connection import CouchDBConnectionManager
-
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
-
-    def tearDown(self):
-        """Clean up singleton instances after each test."""
-        from lib.couchdb.couchdb_connection import CouchDBConnectionManager
-
-        if CouchDBConnectionManager in SingletonMeta._instances:
-            del SingletonMeta._instances[CouchDBConnectionManager]
-
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    def test_decorated_method_with_return_value(self, mock_handler_init):
+    def test_decorated_method_with_return_value(self):
         """Test decorated method that returns a value gets passed through correctly."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
+        mock_doc = self.mock_doc
 
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
+        manager = _make_manager(mock_doc)
 
         # Act
         result = manager.add_sample("P12345", "S001", "pending")
@@ -774,47 +769,35 @@ class TestEdgeCasesAndIntegration(unittest.TestCase):
         # In this case, add_sample doesn't explicitly return anything, so None is expected
         self.assertIsNone(result)
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    @patch("lib.couchdb.yggdrasil_db_manager.logging")
-    def test_save_document_with_put_document_exception(
-        self, mock_logging, mock_handler_init
-    ):
+    def test_save_document_with_put_document_exception(self):
         """Test save_document when put_document raises an exception."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_server = MagicMock()
-
         # Mock get_document succeeds, but put_document fails
-        mock_server.get_document.return_value.get_result.return_value = {
-            "_id": "P12345",
-            "_rev": "1-abc",
-        }
-        mock_server.put_document.side_effect = Exception("Put failed")
+        mock_server = _make_server(
+            get_result={"_id": "P12345", "_rev": "1-abc"},
+            put_exc=_PUT_ERR,
+        )
 
         manager = YggdrasilDBManager()
         manager.server = mock_server
         manager.db_name = "yggdrasil"
 
-        mock_doc = MagicMock()
-        mock_doc._id = "P12345"
-        mock_doc.to_dict.return_value = {"_id": "P12345", "data": "test"}
+        mock_doc = SimpleNamespace(
+            _id="P12345", to_dict=lambda: {"_id": "P12345", "data": "test"}
+        )
 
         # Act
         manager.save_document(mock_doc)
 
         # Assert
-        mock_logging.error.assert_called_with("Error saving document: Put failed")
+        self.mock_logging.error.assert_called_with("Error saving document: Put failed")
 
-    @patch("lib.couchdb.yggdrasil_db_manager.CouchDBHandler.__init__")
-    def test_multiple_decorated_methods_same_project(self, mock_handler_init):
+    def test_multiple_decorated_methods_same_project(self):
         """Test multiple decorated method calls on the same project work correctly."""
         # Arrange
-        mock_handler_init.return_value = None
-        mock_doc = MagicMock()
+        mock_doc = self.mock_doc
 
-        manager = YggdrasilDBManager()
-        manager.get_document_by_project_id = MagicMock(return_value=mock_doc)
-        manager.save_document = MagicMock()
+        manager = _make_manager(mock_doc)
 
         # Act - call multiple decorated methods on the same project
         manager.add_sample("P12345", "S001", "pending")
@@ -822,14 +805,16 @@ class TestEdgeCasesAndIntegration(unittest.TestCase):
         manager.update_sample_slurm_job_id("P12345", "S001", "12345")
 
         # Assert - verify each method was called and document was saved each time
-        self.assertEqual(manager.get_document_by_project_id.call_count, 3)
-        self.assertEqual(manager.save_document.call_count, 3)
-        mock_doc.add_sample.assert_called_once_with(sample_id="S001", status="pending")
-        mock_doc.update_sample_status.assert_called_once_with(
-            sample_id="S001", status="completed"
-        )
-        mock_doc.update_sample_field.assert_called_once_with(
-            "S001", "slurm_job_id", "12345"
+        self.assertEqual(
+            manager.get_document_by_project_id.call_args_list, [call("P12345")] * 3
+        )
+        self.assertEqual(manager.save_document.call_args_list, [call(mock_doc)] * 3)
+        mock_doc.assert_has_calls(
+            [
+                call.add_sample(sample_id="S001", status="pending"),
+                call.update_sample_status(sample_id="S001", status="completed"),
+                call.update_sample_field("S001", "slurm_job_id", "12345"),
+            ],
         )
 
 
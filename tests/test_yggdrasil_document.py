@@ -1,8 +1,75 @@
+import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from collections.abc import Mapping
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import Mock, call, patch
 
 from lib.couchdb.yggdrasil_document import YggdrasilDocument
 
+# Read-only fixtures shared by every test. Anything handed to a document is
+# deep-copied first, since documents mutate nested lists (e.g. flowcell IDs)
+# in place and would otherwise leak state between tests.
+_PROJECT_ID = "P12345"
+_PROJECTS_REFERENCE = "ref_12345"
+_PROJECT_NAME = "Test Project"
+_METHOD = "10X"
+
+_SAMPLE_DATA = {
+    "sample_id": "S001",
+    "status": "pending",
+    "slurm_job_id": "123456",
+    "start_time": "2024-01-01T10:00:00",
+    "end_time": "",
+    "flowcell_ids_processed_for": ["FC001"],
+    "QC": "Pending",
+    "delivered": False,
+}
+
+# Frozen, so tests can hand it out by reference instead of copying it
+_USER_INFO: Mapping[str, Mapping[str, str | None]] = MappingProxyType(
+    {
+        "owner": MappingProxyType({"name": "John Doe", "email": "john@example.com"}),
+        "pi": MappingProxyType({"name": "Jane Smith", "email": "jane@example.com"}),
+    }
+)
+
+_NGI_REPORT = {
+    "file_name": "P12345_ngi_report.html",
+    "date_created": "2025-02-02_10:20:30",
+    "signee": "Dr. Smith",
+    "date_signed": "2025-02-02_15:30:00",
+    "rejected": False,
+    "samples_included": ["S001", "S002"],
+}
+
+_DELIVERY_DATA = {
+    "dds_project_id": "DDS123",
+    "date_uploaded": "2025-02-10_14:01:00",
+    "date_released": "2025-02-10_17:25:00",
+    "samples_included": ["P12345_101", "P12345_102"],
+    "total_volume": "100GB",
+}
+
+# Complete document data for from_dict testing
+_COMPLETE_DOCUMENT_DATA = {
+    "project_id": _PROJECT_ID,
+    "projects_reference": _PROJECTS_REFERENCE,
+    "project_name": _PROJECT_NAME,
+    "method": _METHOD,
+    "project_status": "ongoing",
+    "start_date": "2024-01-01T00:00:00",
+    "end_date": "",
+    "samples": [_SAMPLE_DATA.copy()],
+    "user_info": _USER_INFO,
+    "delivery_info": {
+        "sensitive": True,
+        "delivery_results": [_DELIVERY_DATA.copy()],
+    },
+    "ngi_report": [_NGI_REPORT.copy()],
+}
+
 
 class TestYggdrasilDocument(unittest.TestCase):
     """
@@ -10,88 +77,78 @@ class TestYggdrasilDocument(unittest.TestCase):
     Tests initialization, sample management, project status, NGI reports, and edge cases.
     """
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Mock datetime to have consistent timestamps in tests
-        self.mock_datetime = "2024-01-01T12:00:00"
-
-        # Basic test data
-        self.test_project_id = "P12345"
-        self.test_projects_reference = "ref_12345"
-        self.test_project_name = "Test Project"
-        self.test_method = "10X"
-
-        # Sample test data
-        self.test_sample_data = {
-            "sample_id": "S001",
-            "status": "pending",
-            "slurm_job_id": "123456",
-            "start_time": "2024-01-01T10:00:00",
-            "end_time": "",
-            "flowcell_ids_processed_for": ["FC001"],
-            "QC": "Pending",
-            "delivered": False,
-        }
-
-        # User info test data
-        self.test_user_info: dict[str, dict[str, str | None]] = {
-            "owner": {"name": "John Doe", "email": "john@example.com"},
-            "pi": {"name": "Jane Smith", "email": "jane@example.com"},
-        }
+    # Mock datetime to have consistent timestamps in tests
+    mock_datetime = "2024-01-01T12:00:00"
 
-        # NGI report test data
-        self.test_ngi_report = {
-            "file_name": "P12345_ngi_report.html",
-            "date_created": "2025-02-02_10:20:30",
-            "signee": "Dr. Smith",
-            "date_signed": "2025-02-02_15:30:00",
-            "rejected": False,
-            "samples_included": ["S001", "S002"],
-        }
+    test_project_id = _PROJECT_ID
+    test_projects_reference = _PROJECTS_REFERENCE
+    test_project_name = _PROJECT_NAME
+    test_method = _METHOD
 
-        # Delivery data test
-        self.test_delivery_data = {
-            "dds_project_id": "DDS123",
-            "date_uploaded": "2025-02-10_14:01:00",
-            "date_released": "2025-02-10_17:25:00",
-            "samples_included": ["P12345_101", "P12345_102"],
-            "total_volume": "100GB",
-        }
+    test_sample_data = _SAMPLE_DATA
+    test_user_info = _USER_INFO
+    test_ngi_report = _NGI_REPORT
+    test_delivery_data = _DELIVERY_DATA
+    complete_document_data = _COMPLETE_DOCUMENT_DATA
 
-        # Complete document data for from_dict testing
-        self.complete_document_data = {
-            "project_id": self.test_project_id,
-            "projects_reference": self.test_projects_reference,
-            "project_name": self.test_project_name,
-            "method": self.test_method,
-            "project_status": "ongoing",
-            "start_date": "2024-01-01T00:00:00",
-            "end_date": "",
-            "samples": [self.test_sample_data.copy()],
-            "user_info": self.test_user_info.copy(),
-            "delivery_info": {
-                "sensitive": True,
-                "delivery_results": [self.test_delivery_data.copy()],
-            },
-            "ngi_report": [self.test_ngi_report.copy()],
+    _EXPECTED_TO_DICT_KEYS = frozenset(
+        {
+            "_id",
+            "projects_reference",
+            "method",
+            "project_id",
+            "project_name",
+            "project_status",
+            "start_date",
+            "end_date",
+            "samples",
+            "delivery_info",
+            "ngi_report",
+            "user_info",
         }
+    )
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_init_success(self, mock_datetime):
-        """Test successful initialization of YggdrasilDocument."""
-        # Arrange
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
+    @classmethod
+    def setUpClass(cls):
+        # Patch datetime and logging once for the class instead of per test
+        datetime_patcher = patch(
+            "lib.couchdb.yggdrasil_document.datetime", new_callable=Mock
         )
+        mock_datetime_module = datetime_patcher.start()
+        cls.addClassCleanup(datetime_patcher.stop)
+        # Bind the leaf of datetime.datetime.now().isoformat once
+        cls.mock_isoformat = mock_datetime_module.datetime.now.return_value.isoformat
+        logging_patcher = patch(
+            "lib.couchdb.yggdrasil_document.logging", new_callable=Mock
+        )
+        cls.mock_logging = logging_patcher.start()
+        cls.addClassCleanup(logging_patcher.stop)
 
-        # Act
-        doc = YggdrasilDocument(
+    def setUp(self):
+        self.mock_logging.reset_mock()
+        self.mock_isoformat.return_value = self.mock_datetime
+
+    def _fresh_doc(self) -> YggdrasilDocument:
+        """Return a new, empty document for the standard test project."""
+        return YggdrasilDocument(
             project_id=self.test_project_id,
             projects_reference=self.test_projects_reference,
             project_name=self.test_project_name,
             method=self.test_method,
         )
 
+    def _require_sample(self, doc: YggdrasilDocument, sample_id: str) -> dict[str, Any]:
+        """Return the sample, failing the test if the document lacks it."""
+        sample = doc.get_sample(sample_id)
+        if sample is None:
+            self.fail(f"Sample '{sample_id}' not found.")
+        return sample
+
+    def test_init_success(self):
+        """Test successful initialization of YggdrasilDocument."""
+        # Act
+        doc = self._fresh_doc()
+
         # Assert
         self.assertEqual(doc._id, self.test_project_id)
         self.assertEqual(doc.project_id, self.test_project_id)
@@ -106,14 +163,8 @@ class TestYggdrasilDocument(unittest.TestCase):
         self.assertEqual(doc.ngi_report, [])
         self.assertEqual(doc.user_info, {})
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_from_dict_complete_data(self, mock_datetime):
+    def test_from_dict_complete_data(self):
         """Test creating document from complete dictionary data."""
-        # Arrange
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
-
         # Act
         doc = YggdrasilDocument.from_dict(self.complete_document_data)
 
@@ -131,13 +182,9 @@ class TestYggdrasilDocument(unittest.TestCase):
         self.assertTrue(doc.delivery_info["sensitive"])
         self.assertEqual(len(doc.ngi_report), 1)
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_from_dict_minimal_data(self, mock_datetime):
+    def test_from_dict_minimal_data(self):
         """Test creating document from minimal dictionary data."""
         # Arrange
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
         minimal_data = {
             "project_id": self.test_project_id,
             "projects_reference": self.test_projects_reference,
@@ -158,13 +205,9 @@ class TestYggdrasilDocument(unittest.TestCase):
         self.assertEqual(doc.delivery_info["delivery_results"], [])
         self.assertEqual(doc.ngi_report, [])
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_from_dict_missing_delivery_results(self, mock_datetime):
+    def test_from_dict_missing_delivery_results(self):
         """Test creating document when delivery_info lacks delivery_results."""
         # Arrange
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
         data_without_delivery_results = self.complete_document_data.copy()
         data_without_delivery_results["delivery_info"] = {"sensitive": True}
 
@@ -175,38 +218,32 @@ class TestYggdrasilDocument(unittest.TestCase):
         self.assertIn("delivery_results", doc.delivery_info)
         self.assertEqual(doc.delivery_info["delivery_results"], [])
 
+    def test_from_dict_interns_sample_statuses(self):
+        """Test sample statuses read from a dictionary are interned."""
+        # Arrange: build the status at runtime so it is a distinct object
+        status = "".join(["comp", "leted"])
+        data = {"samples": [{"sample_id": "S001", "status": status}]}
+
+        # Act
+        doc = YggdrasilDocument.from_dict(data)
+
+        # Assert
+        self.assertIs(doc.samples[0]["status"], sys.intern("completed"))
+
     def test_to_dict_complete(self):
         """Test converting document to dictionary representation."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
-        doc.user_info = self.test_user_info.copy()
-        doc.ngi_report = [self.test_ngi_report.copy()]
+        doc = self._fresh_doc()
+        # to_dict only reads these, so the shared fixtures need no copies
+        doc.samples = [self.test_sample_data]
+        doc.user_info = self.test_user_info
+        doc.ngi_report = [self.test_ngi_report]
 
         # Act
         result = doc.to_dict()
 
         # Assert
-        expected_keys = {
-            "_id",
-            "projects_reference",
-            "method",
-            "project_id",
-            "project_name",
-            "project_status",
-            "start_date",
-            "end_date",
-            "samples",
-            "delivery_info",
-            "ngi_report",
-            "user_info",
-        }
-        self.assertEqual(set(result.keys()), expected_keys)
+        self.assertEqual(result.keys(), self._EXPECTED_TO_DICT_KEYS)
         self.assertEqual(result["_id"], self.test_project_id)
         self.assertEqual(result["project_id"], self.test_project_id)
         self.assertEqual(len(result["samples"]), 1)
@@ -215,12 +252,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_set_user_info_new_role(self):
         """Test setting user info for new roles."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         # Act
         doc.set_user_info(self.test_user_info)
@@ -234,12 +266,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_set_user_info_update_existing(self):
         """Test updating existing user info."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.user_info = {"owner": {"name": "Old Name", "email": "old@example.com"}}
 
         new_info: dict[str, dict[str, str | None]] = {
@@ -259,12 +286,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_set_user_info_none_values(self):
         """Test setting user info with None values."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         user_info_with_none = {"owner": {"name": "John Doe", "email": None}}
 
@@ -277,19 +299,10 @@ class TestYggdrasilDocument(unittest.TestCase):
             doc.user_info["owner"]["email"], ""
         )  # None converted to empty string
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_add_sample_new(self, mock_datetime):
+    def test_add_sample_new(self):
         """Test adding a new sample."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
+        doc = self._fresh_doc()
 
         # Act
         doc.add_sample(
@@ -312,19 +325,10 @@ class TestYggdrasilDocument(unittest.TestCase):
         self.assertFalse(sample["delivered"])
         self.assertEqual(sample["QC"], "")
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_add_sample_defaults(self, mock_datetime):
+    def test_add_sample_defaults(self):
         """Test adding a sample with default values."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
+        doc = self._fresh_doc()
 
         # Act
         doc.add_sample(sample_id="S002")
@@ -343,13 +347,8 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_add_sample_update_existing(self):
         """Test updating an existing sample."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
 
         # Act
         doc.add_sample(
@@ -372,12 +371,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_add_sample_duplicate_flowcells(self):
         """Test adding duplicate flowcell IDs are deduplicated."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.samples = [
             {
                 "sample_id": "S001",
@@ -403,13 +397,8 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_get_sample_existing(self):
         """Test retrieving an existing sample."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
 
         # Act
         result = doc.get_sample("S001")
@@ -423,13 +412,8 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_get_sample_nonexistent(self):
         """Test retrieving a non-existent sample returns None."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
 
         # Act
         result = doc.get_sample("S999")
@@ -437,171 +421,106 @@ class TestYggdrasilDocument(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_update_sample_status_success(self, mock_logging, mock_datetime):
+    def test_update_sample_status_success(self):
         """Test successful sample status update."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
-        doc.check_project_completion = MagicMock()
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
+        doc.check_project_completion = Mock()
 
         # Act
         result = doc.update_sample_status("S001", "processing")
 
         # Assert
         self.assertTrue(result)
-        sample = doc.get_sample("S001")
-        self.assertIsNotNone(sample)
-        if sample is not None:
-            self.assertEqual(sample["status"], "processing")
-            self.assertEqual(
-                sample["start_time"], self.mock_datetime
-            )  # Should be set for processing status
+        sample = self._require_sample(doc, "S001")
+        self.assertEqual(sample["status"], "processing")
+        self.assertEqual(
+            sample["start_time"], self.mock_datetime
+        )  # Should be set for processing status
         doc.check_project_completion.assert_called_once()
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_update_sample_status_completion_sets_end_time(self, mock_datetime):
+    def test_update_sample_status_completion_sets_end_time(self):
         """Test that completion statuses set end_time."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
-        doc.check_project_completion = MagicMock()
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
+        doc.check_project_completion = Mock()
 
         # Act
         doc.update_sample_status("S001", "completed")
 
         # Assert
-        sample = doc.get_sample("S001")
-        self.assertIsNotNone(sample)
-        if sample is not None:
-            self.assertEqual(sample["status"], "completed")
-            self.assertEqual(sample["end_time"], self.mock_datetime)
-
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_update_sample_status_nonexistent(self, mock_logging):
-        """Test updating status of non-existent sample."""
-        # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-
-        # Act
-        result = doc.update_sample_status("S999", "completed")
-
-        # Assert
-        self.assertFalse(result)
-        mock_logging.error.assert_called_with(
-            f"Sample 'S999' not found in project '{self.test_project_id}'."
-        )
-
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_set_sample_qc_status_success(self, mock_logging):
-        """Test setting QC status for existing sample."""
-        # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
-
-        # Act
-        doc.set_sample_qc_status("S001", "Passed")
-
-        # Assert
-        sample = doc.get_sample("S001")
-        self.assertIsNotNone(sample)
-        if sample is not None:
-            self.assertEqual(sample["QC"], "Passed")
-
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_set_sample_qc_status_nonexistent(self, mock_logging):
-        """Test setting QC status for non-existent sample."""
-        # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-
-        # Act
-        doc.set_sample_qc_status("S999", "Passed")
-
-        # Assert
-        mock_logging.error.assert_called_with("Cannot set QC: sample 'S999' not found.")
+        sample = self._require_sample(doc, "S001")
+        self.assertEqual(sample["status"], "completed")
+        self.assertEqual(sample["end_time"], self.mock_datetime)
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_mark_sample_as_delivered_success(self, mock_logging):
-        """Test marking sample as delivered."""
-        # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
-
-        # Act
-        doc.mark_sample_as_delivered("S001")
+    def test_set_sample_flag_success(self):
+        """Test setting QC status and delivered flag on an existing sample."""
+        cases = [
+            ("set_sample_qc_status", ("S001", "Passed"), "QC", "Passed"),
+            ("mark_sample_as_delivered", ("S001",), "delivered", True),
+        ]
+        for method, args, field, expected in cases:
+            with self.subTest(method=method):
+                # Arrange
+                doc = self._fresh_doc()
+                doc.samples = [deepcopy(self.test_sample_data)]
+
+                # Act
+                getattr(doc, method)(*args)
+
+                # Assert
+                sample = self._require_sample(doc, "S001")
+                self.assertEqual(sample[field], expected)
+
+    def test_nonexistent_sample_logs_error(self):
+        """Test sample-level updates on a non-existent sample log an error."""
+        cases = [
+            (
+                "update_sample_status",
+                ("S999", "completed"),
+                False,
+                f"Sample 'S999' not found in project '{self.test_project_id}'.",
+            ),
+            (
+                "set_sample_qc_status",
+                ("S999", "Passed"),
+                None,
+                "Cannot set QC: sample 'S999' not found.",
+            ),
+            (
+                "mark_sample_as_delivered",
+                ("S999",),
+                None,
+                "Cannot mark delivered: sample 'S999' not found.",
+            ),
+            (
+                "update_sample_field",
+                ("S999", "slurm_job_id", "123456"),
+                False,
+                f"Cannot update field 'slurm_job_id' for sample 'S999' "
+                f"in project '{self.test_project_id}': sample not found.",
+            ),
+        ]
+        for method, args, expected_result, message in cases:
+            with self.subTest(method=method):
+                # Arrange
+                doc = self._fresh_doc()
+                self.mock_logging.reset_mock()
 
-        # Assert
-        sample = doc.get_sample("S001")
-        self.assertIsNotNone(sample)
-        if sample is not None:
-            self.assertTrue(sample["delivered"])
-
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_mark_sample_as_delivered_nonexistent(self, mock_logging):
-        """Test marking non-existent sample as delivered."""
-        # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+                # Act
+                result = getattr(doc, method)(*args)
 
-        # Act
-        doc.mark_sample_as_delivered("S999")
-
-        # Assert
-        mock_logging.error.assert_called_with(
-            "Cannot mark delivered: sample 'S999' not found."
-        )
+                # Assert
+                self.assertEqual(result, expected_result)
+                self.mock_logging.error.assert_called_once_with(message)
 
     def test_get_sample_status_existing(self):
         """Test getting status of existing sample."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
 
         # Act
         result = doc.get_sample_status("S001")
@@ -612,12 +531,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_get_sample_status_nonexistent(self):
         """Test getting status of non-existent sample."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         # Act
         result = doc.get_sample_status("S999")
@@ -625,108 +539,64 @@ class TestYggdrasilDocument(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_update_sample_field_success(self, mock_logging):
+    def test_update_sample_field_success(self):
         """Test updating a sample field."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
-        doc.check_project_completion = MagicMock()
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
+        doc.check_project_completion = Mock()
 
         # Act
         result = doc.update_sample_field("S001", "slurm_job_id", "789012")
 
         # Assert
         self.assertTrue(result)
-        sample = doc.get_sample("S001")
-        self.assertIsNotNone(sample)
-        if sample is not None:
-            self.assertEqual(sample["slurm_job_id"], "789012")
+        sample = self._require_sample(doc, "S001")
+        self.assertEqual(sample["slurm_job_id"], "789012")
         doc.check_project_completion.assert_called_once()
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_update_sample_field_status_warning(self, mock_logging):
+    def test_update_sample_field_status_warning(self):
         """Test updating sample status field gives warning and redirects."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
-        doc.update_sample_status = MagicMock(return_value=True)
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
+        doc.update_sample_status = Mock(return_value=True)
 
         # Act
         result = doc.update_sample_field("S001", "status", "completed")
 
         # Assert
         self.assertTrue(result)
-        mock_logging.warning.assert_called_with(
-            "Attempted to update sample status via 'update_sample_field';"
-        )
-        mock_logging.info.assert_called_with(
-            "Attempting to use 'update_sample_status'."
+        self.mock_logging.assert_has_calls(
+            [
+                call.warning(
+                    "Attempted to update sample status via 'update_sample_field';"
+                ),
+                call.info("Attempting to use 'update_sample_status'."),
+            ]
         )
         doc.update_sample_status.assert_called_once_with("S001", "completed")
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_update_sample_field_status_no_value(self, mock_logging):
+    def test_update_sample_field_status_no_value(self):
         """Test updating sample status field with empty value."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.samples = [self.test_sample_data.copy()]
+        doc = self._fresh_doc()
+        doc.samples = [deepcopy(self.test_sample_data)]
 
         # Act
         result = doc.update_sample_field("S001", "status", "")
 
         # Assert
         self.assertFalse(result)
-        mock_logging.warning.assert_called_with(
+        self.mock_logging.warning.assert_called_with(
             "Attempted to update sample status via 'update_sample_field';"
         )
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_update_sample_field_nonexistent_sample(self, mock_logging):
-        """Test updating field of non-existent sample."""
-        # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-
-        # Act
-        result = doc.update_sample_field("S999", "slurm_job_id", "123456")
-
-        # Assert
-        self.assertFalse(result)
-        mock_logging.error.assert_called_with(
-            f"Cannot update field 'slurm_job_id' for sample 'S999' "
-            f"in project '{self.test_project_id}': sample not found."
-        )
-
     def test_sync_project_metadata(self):
         """Test syncing project metadata."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.set_user_info = MagicMock()
+        doc = self._fresh_doc()
+        doc.set_user_info = Mock()
 
         # Act
         doc.sync_project_metadata(self.test_user_info, True)
@@ -735,19 +605,10 @@ class TestYggdrasilDocument(unittest.TestCase):
         doc.set_user_info.assert_called_once_with(self.test_user_info)
         self.assertTrue(doc.delivery_info["sensitive"])
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_update_project_status_completed(self, mock_datetime):
+    def test_update_project_status_completed(self):
         """Test updating project status to completed sets end_date."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
+        doc = self._fresh_doc()
 
         # Act
         doc.update_project_status("completed")
@@ -756,23 +617,12 @@ class TestYggdrasilDocument(unittest.TestCase):
         self.assertEqual(doc.project_status, "completed")
         self.assertEqual(doc.end_date, self.mock_datetime)
 
-    @patch("lib.couchdb.yggdrasil_document.datetime")
-    def test_update_project_status_completed_preserves_existing_end_date(
-        self, mock_datetime
-    ):
+    def test_update_project_status_completed_preserves_existing_end_date(self):
         """Test updating to completed preserves existing end_date."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         existing_end_date = "2023-12-31T23:59:59"
         doc.end_date = existing_end_date
-        mock_datetime.datetime.now.return_value.isoformat.return_value = (
-            self.mock_datetime
-        )
 
         # Act
         doc.update_project_status("completed")
@@ -784,12 +634,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_update_project_status_ongoing_clears_end_date(self):
         """Test updating project status to ongoing clears end_date."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.end_date = "2024-01-01T12:00:00"
 
         # Act
@@ -802,77 +647,60 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_check_project_completion_processing(self):
         """Test project status becomes 'processing' when samples are active."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.samples = [
             {"sample_id": "S001", "status": "processing"},
             {"sample_id": "S002", "status": "pending"},
         ]
-        doc.update_project_status = MagicMock()
+        status_updates: list[str] = []
+        doc.update_project_status = status_updates.append
 
         # Act
         doc.check_project_completion()
 
         # Assert
-        doc.update_project_status.assert_called_once_with("processing")
+        self.assertEqual(status_updates, ["processing"])
 
     def test_check_project_completion_completed(self):
         """Test project status becomes 'processing' when all samples are finished."""
         # Note: There seems to be a bug in the original code - it calls "processing" instead of "completed"
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.samples = [
             {"sample_id": "S001", "status": "completed"},
             {"sample_id": "S002", "status": "aborted"},
         ]
-        doc.update_project_status = MagicMock()
+        status_updates: list[str] = []
+        doc.update_project_status = status_updates.append
 
         # Act
         doc.check_project_completion()
 
         # Assert
         # Note: The current implementation has a bug - it sets to "processing" instead of "completed"
-        doc.update_project_status.assert_called_once_with("processing")
+        self.assertEqual(status_updates, ["processing"])
 
     def test_check_project_completion_pending(self):
         """Test project status becomes 'pending' when all samples are not started."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.samples = [
             {"sample_id": "S001", "status": "pending"},
             {"sample_id": "S002", "status": "unsequenced"},
         ]
-        doc.update_project_status = MagicMock()
+        status_updates: list[str] = []
+        doc.update_project_status = status_updates.append
 
         # Act
         doc.check_project_completion()
 
         # Assert
-        doc.update_project_status.assert_called_once_with("pending")
+        self.assertEqual(status_updates, ["pending"])
 
     def test_check_project_completion_partially_completed(self):
         """Test project status becomes 'partially_completed' for mixed states."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.samples = [
             {"sample_id": "S001", "status": "completed"},
             {
@@ -880,24 +708,21 @@ class TestYggdrasilDocument(unittest.TestCase):
                 "status": "failed",
             },  # Neither active, finished, nor not_started
         ]
-        doc.update_project_status = MagicMock()
+        status_updates: list[str] = []
+        doc.update_project_status = status_updates.append
 
         # Act
         doc.check_project_completion()
 
         # Assert
-        doc.update_project_status.assert_called_once_with("partially_completed")
+        self.assertEqual(status_updates, ["partially_completed"])
 
     def test_check_project_completion_no_samples(self):
         """Test project completion check with no samples."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
-        doc.update_project_status = MagicMock()
+        doc = self._fresh_doc()
+        status_updates: list[str] = []
+        doc.update_project_status = status_updates.append
 
         # Act
         doc.check_project_completion()
@@ -905,17 +730,12 @@ class TestYggdrasilDocument(unittest.TestCase):
         # Assert
         # Note: With no samples, all([]) returns True, so the "all finished" condition is met
         # The current implementation sets this to "processing" (possibly a bug, but matching current behavior)
-        doc.update_project_status.assert_called_once_with("processing")
+        self.assertEqual(status_updates, ["processing"])
 
     def test_get_project_status(self):
         """Test getting project status."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.project_status = "processing"
 
         # Act
@@ -924,16 +744,10 @@ class TestYggdrasilDocument(unittest.TestCase):
         # Assert
         self.assertEqual(result, "processing")
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_add_ngi_report_entry_success(self, mock_logging):
+    def test_add_ngi_report_entry_success(self):
         """Test successful NGI report entry addition."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         # Act
         result = doc.add_ngi_report_entry(self.test_ngi_report)
@@ -943,16 +757,10 @@ class TestYggdrasilDocument(unittest.TestCase):
         self.assertEqual(len(doc.ngi_report), 1)
         self.assertEqual(doc.ngi_report[0], self.test_ngi_report)
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_add_ngi_report_entry_invalid_data(self, mock_logging):
+    def test_add_ngi_report_entry_invalid_data(self):
         """Test NGI report entry addition with invalid data."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         invalid_report = {"file_name": "test.html"}  # Missing required keys
 
@@ -962,20 +770,14 @@ class TestYggdrasilDocument(unittest.TestCase):
         # Assert
         self.assertFalse(result)
         self.assertEqual(len(doc.ngi_report), 0)
-        mock_logging.error.assert_called_with(
+        self.mock_logging.error.assert_called_with(
             "Invalid report_data format or missing required keys."
         )
 
-    @patch("lib.couchdb.yggdrasil_document.logging")
-    def test_add_ngi_report_entry_non_dict(self, mock_logging):
+    def test_add_ngi_report_entry_non_dict(self):
         """Test NGI report entry addition with non-dict data."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         # Act
         result = doc.add_ngi_report_entry("not a dict")  # type: ignore
@@ -983,19 +785,14 @@ class TestYggdrasilDocument(unittest.TestCase):
         # Assert
         self.assertFalse(result)
         self.assertEqual(len(doc.ngi_report), 0)
-        mock_logging.error.assert_called_with(
+        self.mock_logging.error.assert_called_with(
             "Invalid report_data format or missing required keys."
         )
 
     def test_add_delivery_entry(self):
         """Test adding delivery entry."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         # Act
         doc.add_delivery_entry(self.test_delivery_data)
@@ -1009,12 +806,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_add_delivery_entry_creates_delivery_results(self):
         """Test adding delivery entry when delivery_results doesn't exist."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.delivery_info = {}  # Remove delivery_results
 
         # Act
@@ -1030,12 +822,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_get_delivery_status_existing(self):
         """Test getting existing delivery status."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
         doc.delivery_info["status"] = "delivered"
 
         # Act
@@ -1047,12 +834,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_get_delivery_status_missing(self):
         """Test getting delivery status when not set."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         # Act
         result = doc.get_delivery_status()
@@ -1063,12 +845,7 @@ class TestYggdrasilDocument(unittest.TestCase):
     def test_set_delivery_status(self):
         """Test setting delivery status."""
         # Arrange
-        doc = YggdrasilDocument(
-            project_id=self.test_project_id,
-            projects_reference=self.test_projects_reference,
-            project_name=self.test_project_name,
-            method=self.test_method,
-        )
+        doc = self._fresh_doc()
 
         # Act
         doc.set_delivery_status("in_progress")
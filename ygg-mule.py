@@ -24,12 +24,13 @@ async def launch_realm(realm):
         logging.error(f"Error in realm.launch(): {e}", exc_info=True)
 
 
-def process_project_doc(doc_id):
+def process_project_doc(doc_id, runner):
     """Fetch a project doc from the ProjectDB by its doc_id,
     find which analysis module to load, and execute that module.
 
     Args:
         doc_id (str): The ID of the document to process.
+        runner (asyncio.Runner): The runner to launch the realm on.
     """
     # Initialize the database managers
     pdm = ProjectDBManager()
@@ -55,7 +56,7 @@ def process_project_doc(doc_id):
         if RealmClass:
             realm = RealmClass(document, ydm)
             if realm.proceed:
-                asyncio.run(launch_realm(realm))
+                runner.run(launch_realm(realm))
                 logging.info("Processing complete.")
             else:
                 logging.info(
@@ -67,13 +68,14 @@ def process_project_doc(doc_id):
         logging.error(f"Error while processing project doc: {e}", exc_info=True)
 
 
-def process_yggdrasil_doc(doc_id):
+def process_yggdrasil_doc(doc_id, runner):
     """
     Fetch an Yggdrasil document by its doc_id
     and pass it to the DeliveryManager flow.
 
     Args:
         doc_id (str): The ID of the document to process.
+        runner (asyncio.Runner): The runner to launch the realm on.
     """
     # Initialize the database managers
     ydm = YggdrasilDBManager()
@@ -88,7 +90,7 @@ def process_yggdrasil_doc(doc_id):
     try:
         deliv_realm = DeliveryManager(document, ydm)
         if deliv_realm.proceed:
-            asyncio.run(launch_realm(deliv_realm))
+            runner.run(launch_realm(deliv_realm))
             logging.info("Delivery processing complete.")
         else:
             logging.info(f"Skipping delivery: Not enough info in doc {doc_id}.")
@@ -96,7 +98,6 @@ def process_yggdrasil_doc(doc_id):
         logging.error(f"Error while processing yggdrasil doc: {e}", exc_info=True)
 
 
-# TODO: If the module registry doesn’t change often, consider caching it to avoid reloading it every time
 def get_module_location(document):
     """Retrieve the module location based on the library construction method.
 
@@ -113,11 +114,6 @@ def get_module_location(document):
         # Extract the library construction method from the document
         method = document["details"]["library_construction_method"]
 
-        # Retrieve module configuration for the specified method
-        # module_config = module_registry.get(method)
-        # if module_config:
-        #     return module_config["module"]
-
         # Direct match
         if method in module_registry:
             return module_registry[method]["module"]
@@ -167,11 +163,12 @@ def main():
     # Set manual HPC submission (if enabled)
     YggSession.init_manual_submit(args.manual_submit)
 
-    # Process the document
-    if args.delivery:
-        process_yggdrasil_doc(args.doc_id)
-    else:
-        process_project_doc(args.doc_id)
+    # Process the document, on uvloop's faster event loop when it is installed
+    with asyncio.Runner(loop_factory=Ygg.get_loop_factory()) as runner:
+        if args.delivery:
+            process_yggdrasil_doc(args.doc_id, runner)
+        else:
+            process_project_doc(args.doc_id, runner)
 
 
 if __name__ == "__main__":
@@ -18,8 +18,29 @@ ygg_configs: Mapping[str, Any] = ConfigLoader().load_config("config.json")
 
 
 # Define asynchronous functions for task handling
+async def launch_realm(realm, semaphore: asyncio.Semaphore):
+    """Run a realm's launch() once a concurrency slot is free."""
+    async with semaphore:
+        await realm.launch()
+
+
+def log_task_exception(task: asyncio.Task):
+    """Done-callback logging the exception a realm task ended with, if any."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logging.error("Task raised an exception: %s", exc, exc_info=exc)
+
+
 async def process_couchdb_changes():
-    tasks = []
+    # Realms run concurrently (bounded by tasks_limit) while polling continues
+    tasks: set[asyncio.Task] = set()
+    tasks_limit = ygg_configs.get("tasks_limit", 2)
+    semaphore = asyncio.Semaphore(tasks_limit)
+    # In-flight realms (running or waiting for a slot) before the feed pauses
+    max_pending = 2 * tasks_limit
+    poll_interval = ygg_configs["couchdb_poll_interval"]
     pdm = ProjectDBManager()
     ydm = YggdrasilDBManager()
 
@@ -58,48 +79,45 @@ async def process_couchdb_changes():
                     # if process_project:
                     # Dynamically load the module
                     # module = Ygg.load_module(module_loc)
-                    print(f">>> Module location: {module_loc}")
+                    logging.debug("Module location: %s", module_loc)
                     RealmClass = Ygg.load_realm_class(module_loc)
 
                     if RealmClass:
                         # Call the module's launch function
                         realm = RealmClass(data, ydm)
                         if realm.proceed:
-                            task = asyncio.create_task(realm.launch())
-                            tasks.append(task)
-                            # print(f"Tasks ({realm.project_info['project_id']}): {tasks}")
+                            task = asyncio.create_task(launch_realm(realm, semaphore))
+                            tasks.add(task)
+                            task.add_done_callback(tasks.discard)
+                            task.add_done_callback(log_task_exception)
+                            # Backpressure: once realms fall behind, stop reading
+                            # changes until one of them finishes
+                            while len(tasks) >= max_pending:
+                                await asyncio.wait(
+                                    tasks, return_when=asyncio.FIRST_COMPLETED
+                                )
                         else:
                             logging.info(
-                                f"Skipping task creation due to missing required information. {data.get('project_id')}"
+                                "Skipping task creation due to missing required information. %s",
+                                data.get("project_id"),
                             )
                     else:
                         logging.warning(
-                            f"Failed to load module '{module_loc}' for '{data['details']['library_construction_method']}'."
+                            "Failed to load module '%s' for '%s'.",
+                            module_loc,
+                            data["details"]["library_construction_method"],
                         )
-                except Exception as e:
-                    logging.warning(
-                        f"Error while trying to load module: {e}", exc_info=True
+                except Exception:
+                    # One record with the traceback per failure
+                    logging.exception(
+                        "Error while trying to load module '%s' for project %s",
+                        module_loc,
+                        data.get("project_id"),
                     )
-                    logging.error(f"Data causing the error: {data}")
-
-                # Limit the number of concurrent tasks if necessary
-                # TODO: move to using ygg_configs["tasks_limit"] or similar
-                tasks_limit = 2
-                if len(tasks) >= tasks_limit:
-                    # Wait for all tasks to complete
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-                    # Check for exceptions
-                    for result in results:
-                        if isinstance(result, Exception):
-                            logging.error(
-                                f"Task raised an exception: {result}",
-                                exc_info=True,
-                            )
-                    tasks = []
 
-                # Sleep to avoid excessive polling
-                print("Sleeping in async for loop...")
-                await asyncio.sleep(ygg_configs["couchdb_poll_interval"])
+                # No sleep here: the changes feed pushes documents as they
+                # arrive, and get_changes awaits each line in a worker thread,
+                # so the realm tasks run while the next change is read.
 
             # If an HPC job is required, submit it asynchronously
             # await submit_hpc_job(data)
@@ -109,22 +127,17 @@ async def process_couchdb_changes():
 
             # After the loop, wait for any remaining tasks to complete
             # |<-- if goes one indentation back if except block above is uncommented NOTE
+            # (exceptions are logged by each task's done-callback, so there
+            # are no results to collect)
             if tasks:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for result in results:
-                    if isinstance(result, Exception):
-                        logging.error(
-                            f"Task raised an exception: {result}",
-                            exc_info=True,
-                        )
-                tasks = []
+                await asyncio.wait(tasks)
 
         except Exception as e:
-            logging.error(f"An error occurred: {e}", exc_info=True)
+            logging.error("An error occurred: %s", e, exc_info=True)
 
         # Sleep to avoid excessive polling
-        print("Sleeping in while loop...")
-        await asyncio.sleep(ygg_configs["couchdb_poll_interval"])
+        logging.debug("Sleeping %s s in while loop...", poll_interval)
+        await asyncio.sleep(poll_interval)
 
 
 # Main daemon loop
@@ -134,16 +147,13 @@ async def main():
     """
     # config = load_json_config()
 
-    # Start the asynchronous coroutine for processing CouchDB changes
-    couchdb_task = process_couchdb_changes()
-
-    # tasks = asyncio.all_tasks()
-    # for task in tasks:
-    #     print(f"> {task.get_name()}, {task.get_coro()}")
-
-    # Wait for both tasks to complete
-    await asyncio.gather(couchdb_task)
+    # Run the long-lived daemon tasks under one TaskGroup; a failure in any
+    # of them cancels the rest instead of leaving them running unobserved
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(process_couchdb_changes(), name="couchdb_changes")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when it is installed
+    with asyncio.Runner(loop_factory=Ygg.get_loop_factory()) as runner:
+        runner.run(main())
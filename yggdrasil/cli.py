@@ -1,6 +1,7 @@
 import argparse
 import asyncio
 
+from lib.core_utils.common import YggdrasilUtilities as Ygg
 from lib.core_utils.config_loader import ConfigLoader
 
 # import logging
@@ -98,11 +99,16 @@ def main():
 
         # (future)Daemon: set up watchers and run forever
         core.setup_watchers()
-        try:
-            asyncio.run(core.start())
-        except KeyboardInterrupt:
-            logging.warning("[bold red blink] Shutting down Yggdrasil daemon... [/]")
-            asyncio.run(core.stop())
+        # Use uvloop's faster event loop when it is installed; stop() runs on
+        # the same loop as start()
+        with asyncio.Runner(loop_factory=Ygg.get_loop_factory()) as runner:
+            try:
+                runner.run(core.start())
+            except KeyboardInterrupt:
+                logging.warning(
+                    "[bold red blink] Shutting down Yggdrasil daemon... [/]"
+                )
+                runner.run(core.stop())
 
     elif args.mode == "run-doc":
         # One‑off run
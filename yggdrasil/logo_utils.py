@@ -2,47 +2,46 @@
 ASCII logo display utilities for Yggdrasil CLI.
 """
 
+import functools
+import sys
+from importlib.resources import files
 from pathlib import Path
 
+# Shown when the logo asset cannot be found
+_FALLBACK_LOGO = """
+    ╭─────────────────────────────────╮
+    │                                 │
+    │    ┬ ┬┌─┐┌─┐┌┬┐┬─┐┌─┐┌─┐┬┬      │
+    │    └┬┘│ ┬│ ┬ ││├┬┘├─┤└─┐││      │
+    │     ┴ └─┘└─┘─┴┘┴└─┴ ┴└─┘┴└─┘    │
+    │                                 │
+    ╰─────────────────────────────────╯
+"""
+
 
+@functools.lru_cache(maxsize=1)
 def get_ascii_logo() -> str:
     """
     Load the ASCII logo from the assets directory.
 
+    The logo never changes during a run, so it is read from disk only once.
+
     Returns:
         str: The ASCII logo content, or a fallback if file not found.
     """
     try:
-        # Try to load from package assets using modern importlib.resources
-        try:
-            from importlib.resources import files
-
-            logo_content = (files("yggdrasil") / "assets" / "ascii-logo.txt").read_text(
-                encoding="utf-8"
-            )
-            return logo_content
-        except ImportError:
-            # Fallback for Python < 3.9
-            from importlib import resources
-
-            with resources.open_text("yggdrasil.assets", "ascii-logo.txt") as f:
-                return f.read()
-    except (ImportError, FileNotFoundError, ModuleNotFoundError):
-        # Fallback for development or if importlib.resources isn't available
+        # Load from package assets using importlib.resources
+        return (files("yggdrasil") / "assets" / "ascii-logo.txt").read_text(
+            encoding="utf-8"
+        )
+    except (FileNotFoundError, ModuleNotFoundError):
+        # Fallback for development, when the package resources aren't available
         try:
             logo_path = Path(__file__).parent / "assets" / "ascii-logo.txt"
             return logo_path.read_text(encoding="utf-8")
         except FileNotFoundError:
             # Ultimate fallback - simple text logo
-            return """
-    ╭─────────────────────────────────╮
-    │                                 │
-    │    ┬ ┬┌─┐┌─┐┌┬┐┬─┐┌─┐┌─┐┬┬      │
-    │    └┬┘│ ┬│ ┬ ││├┬┘├─┤└─┐││      │
-    │     ┴ └─┘└─┘─┴┘┴└─┴ ┴└─┘┴└─┘    │
-    │                                 │
-    ╰─────────────────────────────────╯
-"""
+            return _FALLBACK_LOGO
 
 
 def print_logo(version: str | None = None) -> None:
@@ -52,14 +51,12 @@ def print_logo(version: str | None = None) -> None:
     Args:
         version: Optional version string to display below logo
     """
-    logo = get_ascii_logo()
-    print(logo)
-
+    lines = [get_ascii_logo()]
     if version:
-        version_text = f"    v{version}"
-        print(version_text)
+        lines.append(f"    v{version}")
 
-    print()  # Add spacing after logo
+    # Write everything at once, with a blank line for spacing after the logo
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
 
 if __name__ == "__main__":